@@ -1,16 +1,13 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import os
 from datetime import datetime
-import folium
-from streamlit_folium import st_folium
-from streamlit_lottie import st_lottie
-import requests
 
 # Updated imports – using our modules for formatting and data import
 from modules import importer
 from modules import formater
+from modules import geo
+from modules import render_cache
 
 # Set page configuration using formater module
 title_obj = formater.Title()
@@ -49,12 +46,6 @@ st.markdown("""
 """, unsafe_allow_html=True)
 # ---------------- Sidebar Section ----------------
 # Existing top navigation (Do Not Modify)
-def load_lottie_url(url: str):
-    r = requests.get(url)
-    if r.status_code != 200:
-        return None
-    return r.json()
-
 # All sidebar content is defined within this block.
 with st.sidebar:
     # Navigation widget
@@ -65,11 +56,7 @@ with st.sidebar:
 
     # Animation section
     st.markdown("### Your Career Hub: Explore Opportunities, Skills & Insights!")
-    lottie_animation = load_lottie_url("https://assets5.lottiefiles.com/packages/lf20_jcikwtux.json")
-    if lottie_animation:
-        st_lottie(lottie_animation, height=200, key="sidebar_anim")
-    else:
-        st.error("Animation could not be loaded.")
+    formater.Lottie.show("https://assets5.lottiefiles.com/packages/lf20_jcikwtux.json", key="sidebar_anim")
 
 # ---------- Sidebar Enhancements End ----------
 # Main page content continues here.
@@ -79,11 +66,9 @@ with st.sidebar:
 if 'jobs_data' not in st.session_state:
     st.session_state.jobs_data = None
 
-# Load job data from local CSV using importer
-data_file = os.path.join("data", "google_jobs.csv")
-if os.path.exists(data_file) and st.session_state.jobs_data is None:
-    st.session_state.jobs_data = importer.DataImport.fetch_and_clean_data(max_rows=1000)
-else:
+# Load job data using importer once per session; st.cache_data hands back a new copy on every call,
+# which would invalidate the per-session skill table, cube and dataset hash on each rerun
+if st.session_state.jobs_data is None:
     st.session_state.jobs_data = importer.DataImport.fetch_and_clean_data(max_rows=1000)
 
 # Header Section
@@ -150,21 +135,14 @@ yoy_growth_display = "+24%"
 
 
 if st.session_state.jobs_data is not None:
-    if 'salary_yearly' in st.session_state.jobs_data.columns:
-        salary_data = st.session_state.jobs_data['salary_yearly'].dropna()
-        if not salary_data.empty:
-            avg_salary_display = f"${int(salary_data.mean() / 1000)}K"
-    elif 'salary' in st.session_state.jobs_data.columns:
-        salary_data = st.session_state.jobs_data['salary'].dropna()
-        if not salary_data.empty:
-            avg_salary_display = f"${int(salary_data.mean() / 1000)}K"
+    # Headline numbers are read from the session's aggregate cube instead of the postings
+    cube = importer.DataImport.aggregate_cube(st.session_state.jobs_data)
+    overall = cube.totals()
+    if overall['salary_count'].iloc[0]:
+        avg_salary_display = f"${int(overall['salary_mean'].iloc[0] / 1000)}K"
     if 'description_tokens' in st.session_state.jobs_data.columns:
-        all_skills = []
-        for tokens in st.session_state.jobs_data['description_tokens'].dropna():
-            if isinstance(tokens, str):
-                skills = tokens.strip("[]").replace("'", "").split(", ")
-                all_skills.extend(skills)
-        skill_counts = pd.Series(all_skills).value_counts()
+        skill_table = importer.DataImport.skill_table(st.session_state.jobs_data)
+        skill_counts = cube.totals(['skill']).set_index('skill')['postings'].sort_values(ascending=False, kind='stable')
         if not skill_counts.empty:
             top_skill_display = skill_counts.index[0]
             if 'posted_at' in st.session_state.jobs_data.columns:
@@ -175,12 +153,8 @@ if st.session_state.jobs_data is not None:
                     recent_date = st.session_state.jobs_data['posted_date'].max() - pd.Timedelta(days=90)
                     recent_jobs = st.session_state.jobs_data[st.session_state.jobs_data['posted_date'] >= recent_date]
                     if not recent_jobs.empty and 'description_tokens' in recent_jobs.columns:
-                        recent_skills = []
-                        for tokens in recent_jobs['description_tokens'].dropna():
-                            if isinstance(tokens, str):
-                                skills = tokens.strip("[]").replace("'", "").split(", ")
-                                recent_skills.extend(skills)
-                        recent_skill_counts = pd.Series(recent_skills).value_counts()
+                        recent_skills = skill_table[skill_table['job_id'].isin(recent_jobs.index)]
+                        recent_skill_counts = recent_skills['skill'].value_counts()
                         if not recent_skill_counts.empty:
                             trending_topic_display = recent_skill_counts.index[0]
                 except Exception as e:
@@ -236,67 +210,57 @@ with st.expander("🔍 Filter Options", expanded=False):
     if selected_job_role and selected_job_role != "All Titles":
         filtered_data = filtered_data[filtered_data['title'].str.contains(selected_job_role, case=False, na=False)]
     
-    # Convert country names in filtered_data to English using pycountry.
-    import pycountry
-    def convert_country_to_english(name):
-        try:
-            country = pycountry.countries.lookup(name)
-            return country.name
-        except Exception:
-            return name
-
-    filtered_data['country_english'] = filtered_data['country'].apply(convert_country_to_english)
+    # Country values are matched to the map's ISO codes; each distinct value is looked up once and remembered.
+    country_names = geo.country_names()
     
     # Updated Skill Usage by Country Map using GeoPandas and Matplotlib
     st.markdown("#### Skill Usage by Country Map (GeoPandas)")
     try:
-        import geopandas as gpd
-        import matplotlib.pyplot as plt
-
         # Extract all unique skills from the overall job data for the select box.
-        all_skills = []
-        for tokens in st.session_state.jobs_data['description_tokens'].dropna():
-            if isinstance(tokens, list):
-                all_skills.extend(tokens)
-            elif isinstance(tokens, str):
-                tokens_list = tokens.strip("[]").replace("'", "").split(",")
-                all_skills.extend([x.strip() for x in tokens_list])
-        unique_skills = sorted(set(all_skills))
+        cube = importer.DataImport.aggregate_cube(st.session_state.jobs_data)
+        unique_skills = cube.values('skill')
         
         # Skill selection dropdown.
         selected_skill = st.selectbox("Select Skill for Map Filter", options=unique_skills)
         
-        # Helper function to count occurrences of the selected skill.
-        def count_skill(tokens, skill):
-            if isinstance(tokens, list):
-                return tokens.count(skill)
-            elif isinstance(tokens, str):
-                tokens_list = tokens.strip("[]").replace("'", "").split(",")
-                tokens_list = [x.strip() for x in tokens_list]
-                return tokens_list.count(skill)
-            return 0
-
-        # Aggregate skill usage by country (using the English country names).
-        filtered_data['skill_count'] = filtered_data['description_tokens'].apply(lambda tokens: count_skill(tokens, selected_skill))
-        skill_usage = filtered_data.groupby("country_english")['skill_count'].sum().reset_index()
-
-        # Load world dataset from an external GeoJSON source.
-        geojson_url = "https://raw.githubusercontent.com/datasets/geo-countries/master/data/countries.geojson"
-        world = gpd.read_file(geojson_url)
-
-        # Merge aggregated data with the world GeoDataFrame.
-        world_skill = world.merge(skill_usage, how="left", left_on="ADMIN", right_on="country_english")
-        world_skill['skill_count'] = world_skill['skill_count'].fillna(0)
-
-        # Create the plot.
-        fig, ax = plt.subplots(1, 1, figsize=(12, 8))
-        world_skill.plot(column='skill_count', ax=ax, cmap='YlOrRd', legend=True,
-                         legend_kwds={'label': f"Usage of '{selected_skill}'", 'orientation': "horizontal"})
-        ax.set_title(f"Skill Usage by Country for '{selected_skill}'", fontsize=16)
-        ax.set_axis_off()
-
-        # Display the plot in Streamlit.
-        st.pyplot(fig)
+        def render_skill_map():
+            # matplotlib is only imported when a map has to be drawn, not on cached reruns
+            import matplotlib.pyplot as plt
+
+            # Aggregate skill usage by country.
+            if selected_job_role and selected_job_role != "All Titles":
+                # Titles are not a cube dimension, so a role filter counts the filtered rows
+                skill_table = importer.DataImport.skill_table(st.session_state.jobs_data)
+                skill_jobs = skill_table.loc[skill_table['skill'] == selected_skill, 'job_id']
+                role_data = filtered_data.assign(skill_count=filtered_data.index.isin(skill_jobs).astype(int))
+                skill_usage = role_data.groupby('country')['skill_count'].sum().reset_index()
+            else:
+                skill_usage = cube.slice(country=selected_countries, skill=selected_skill).totals(['country'])
+                skill_usage = skill_usage.rename(columns={'postings': 'skill_count'})
+
+            # Match countries on ISO codes, since map names differ (e.g. "United States of America").
+            skill_usage['iso_a3'] = country_names.iso_a3(skill_usage['country'])
+            skill_usage = skill_usage.groupby('iso_a3')['skill_count'].sum().reset_index()
+
+            # Bundled, pre-simplified country boundaries, parsed once per process.
+            world = geo.WorldMap.boundaries()
+
+            # Merge aggregated data with the world GeoDataFrame.
+            world_skill = world.merge(skill_usage, how="left", left_on="ISO_A3", right_on="iso_a3")
+            world_skill['skill_count'] = world_skill['skill_count'].fillna(0)
+
+            # Create the plot.
+            fig, ax = plt.subplots(1, 1, figsize=(12, 8))
+            world_skill.plot(column='skill_count', ax=ax, cmap='YlOrRd', legend=True,
+                             legend_kwds={'label': f"Usage of '{selected_skill}'", 'orientation': "horizontal"})
+            ax.set_title(f"Skill Usage by Country for '{selected_skill}'", fontsize=16)
+            ax.set_axis_off()
+            return fig
+
+        # Reruns with the same selections (e.g. poll clicks) reuse the rendered PNG; the figure is closed after encoding.
+        map_key = ("skill_map", selected_skill, tuple(sorted(selected_countries)), selected_job_role,
+                   importer.DataImport.dataset_version(st.session_state.jobs_data))
+        st.image(render_cache.shared_render_cache().get_or_render(map_key, render_skill_map), width="stretch")
         
     except Exception as e:
         st.error(f"Error rendering GeoPandas map: {e}")
@@ -364,12 +328,9 @@ if selected_job_role != "All Titles":
     
     top_skills = []
     if not filtered_jobs.empty and 'description_tokens' in filtered_jobs.columns:
-        all_skills = []
-        for tokens in filtered_jobs['description_tokens'].dropna():
-            if isinstance(tokens, str):
-                skills = tokens.strip("[]").replace("'", "").split(", ")
-                all_skills.extend(skills)
-        skill_counts = pd.Series(all_skills).value_counts().head(5)
+        skill_table = importer.DataImport.skill_table(st.session_state.jobs_data)
+        role_skills = skill_table[skill_table['job_id'].isin(filtered_jobs.index)]
+        skill_counts = role_skills['skill'].value_counts().head(5)
         top_skills = skill_counts.index.tolist()
     
     selected_interest = selected_options[0] if selected_options else "technology"
@@ -0,0 +1,331 @@
+"""
+Benchmarks for the analytics hot paths at several table sizes.
+
+Generates synthetic gsearch_jobs.csv-shaped tables (1k / 100k / 1M rows by
+default) and times DataImport.fetch_and_clean_data, serp_api.extract_skills,
+extract_skill_trends (pages/02), extract_skills_data (pages/03),
+extract_skills_vs_pay (pages/04) and the AggregateCube build. Each benchmark
+records the best and median wall time over --repeat runs, plus the peak traced
+memory of one extra run.
+
+Results are written to benchmarks/results/<label>.json (label defaults to the
+current git commit), and --compare prints the change against an earlier run:
+
+    python -m benchmarks.bench_analytics --sizes 1000,100000
+    python -m benchmarks.bench_analytics --compare benchmarks/results/<baseline>.json
+"""
+import os
+import sys
+import logging
+import glob
+import json
+import time
+import platform
+import argparse
+import statistics
+import subprocess
+import tempfile
+import tracemalloc
+import importlib.util
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# Outside `streamlit run`, Streamlit warns about the missing script context on every cached
+# call (and about the missing runtime when the modules are imported). Its loggers get their
+# level reset when the config loads, so these are disabled before anything imports streamlit
+for _name in ("streamlit.runtime.scriptrunner_utils.script_run_context",
+              "streamlit.runtime.caching.cache_data_api"):
+    logging.getLogger(_name).disabled = True
+
+import serp_api
+from modules import importer
+from modules.cube import AggregateCube
+
+RESULTS_DIR = os.path.join(ROOT, "benchmarks", "results")
+SIZES = [1000, 100000, 1000000]
+REGRESSION_THRESHOLD = 0.10  # flag benchmarks more than 10% slower than the baseline
+
+SKILLS = ["python", "sql", "r", "excel", "power_bi", "tableau", "sas", "java", "javascript", "aws", "azure",
+          "gcp", "spark", "hadoop", "docker", "kubernetes", "tensorflow", "pytorch", "snowflake", "looker",
+          "go", "scala", "c++", "airflow", "git", "linux", "pandas", "numpy", "react", "word"]
+COUNTRIES = ["United States", "United Kingdom", "Canada", "Australia", "Germany", "France", "India", "Singapore"]
+VIAS = ["via LinkedIn", "via Indeed", "via Glassdoor", "via ZipRecruiter", "via Upwork"]
+SCHEDULES = ["Full-time", "Part-time", "Contractor", "Internship"]
+TITLES = ["Data Analyst", "Senior Data Analyst", "Data Scientist", "Data Engineer", "Business Analyst"]
+
+
+def synthetic_raw_jobs(rows, seed=42):
+    """
+    Build a raw frame shaped like gsearch_jobs.csv
+
+    Args:
+        rows (int): Number of postings
+        seed (int): Random seed, so every run sees the same table
+
+    Returns:
+        pd.DataFrame: Raw rows, with description_tokens as "['a', 'b']" strings
+    """
+    rng = np.random.default_rng(seed)
+    skills = np.array(SKILLS, dtype=object)
+
+    # A pool of token lists and descriptions is sampled per row; building 1M distinct strings is the slow part
+    pool = 5000
+    picks = [rng.choice(len(skills), rng.integers(3, 12), replace=False) for _ in range(pool)]
+    token_pool = np.array(["[" + ", ".join(f"'{skill}'" for skill in skills[pick]) + "]" for pick in picks], dtype=object)
+    description_pool = np.array([
+        f"We are hiring. You will work with {', '.join(skills[pick])} to build reporting and models. "
+        "Strong communication skills and a degree in a quantitative field are required."
+        for pick in picks
+    ], dtype=object)
+    which = rng.integers(0, pool, rows)
+
+    start = np.datetime64("2022-11-01")
+    posted = start + rng.integers(0, 540, rows).astype("timedelta64[D]")
+    salary = np.where(rng.random(rows) < 0.2, rng.normal(95000, 25000, rows).round(-2), np.nan)
+
+    return pd.DataFrame({
+        "Unnamed: 0": np.arange(rows),
+        "index": np.arange(rows),
+        "title": rng.choice(TITLES, rows),
+        "company_name": rng.choice(["Acme", "Globex", "Initech", "Hooli", "Umbrella"], rows),
+        "location": rng.choice(["Anywhere", "New York, NY", "Kansas City, MO", "London, UK"], rows),
+        "via": rng.choice(VIAS, rows),
+        "description": description_pool[which],
+        "posted_at": posted.astype(str),
+        "schedule_type": rng.choice(SCHEDULES, rows),
+        "work_from_home": rng.random(rows) < 0.3,
+        "country": rng.choice(COUNTRIES, rows),
+        "date_time": posted.astype(str),
+        "salary_yearly": salary,
+        "description_tokens": token_pool[which]
+    })
+
+
+def load_page(prefix):
+    """Import a Streamlit page by its number prefix without running its main()."""
+    path = glob.glob(os.path.join(ROOT, "pages", f"{prefix}_*.py"))[0]
+    spec = importlib.util.spec_from_file_location(f"page_{prefix}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def measure(function, setup=None, repeat=3):
+    """
+    Time a benchmark and trace its peak memory
+
+    Args:
+        function (callable): Called with the value returned by setup
+        setup (callable): Builds a fresh argument before every run (not timed)
+        repeat (int): Timed runs
+
+    Returns:
+        dict: best/median seconds and peak traced memory in MB
+    """
+    setup = setup or (lambda: None)
+    times = []
+    for _ in range(repeat):
+        argument = setup()
+        start = time.perf_counter()
+        function(argument)
+        times.append(time.perf_counter() - start)
+
+    # Memory is traced in a separate run because tracing slows allocation-heavy code
+    argument = setup()
+    tracemalloc.start()
+    try:
+        function(argument)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {"best_seconds": min(times), "median_seconds": statistics.median(times), "peak_mb": peak / 2**20}
+
+
+# Page functions benchmarked as (page prefix, function name)
+PAGE_FUNCTIONS = {
+    "extract_skill_trends": ("02", "extract_skill_trends"),
+    "extract_skills_data": ("03", "extract_skills_data"),
+    "extract_skills_vs_pay": ("04", "extract_skills_vs_pay")
+}
+
+
+def load_page_functions():
+    """Return {name: function}, or the import error for pages whose dependencies are missing."""
+    functions = {}
+    modules = {}
+    for name, (prefix, attribute) in PAGE_FUNCTIONS.items():
+        try:
+            if prefix not in modules:
+                modules[prefix] = load_page(prefix)
+            functions[name] = getattr(modules[prefix], attribute)
+        except Exception as e:
+            functions[name] = e
+    return functions
+
+
+def benchmarks_for(raw, page_functions):
+    """Return {name: (function, setup)} for one table size."""
+    rows = len(raw)
+    clean = importer.DataImport.clean_data(raw.copy())
+    descriptions = raw["description"]
+
+    def fetch_and_clean(_):
+        # The cached function is cleared first so every run parses the CSV
+        importer.DataImport.fetch_and_clean_data.clear()
+        return importer.DataImport.fetch_and_clean_data(max_rows=rows, use_snapshot=False)
+
+    cases = {
+        "fetch_and_clean_data": (fetch_and_clean, None),
+        "extract_skills": (lambda texts: [serp_api.extract_skills(text) for text in texts], lambda: descriptions),
+        "extract_skills_batch": (serp_api.extract_skills_batch, lambda: descriptions),
+        "aggregate_cube": (
+            lambda jobs: AggregateCube.from_jobs(jobs, importer.DataImport.build_skill_table(jobs)), lambda: clean
+        )
+    }
+    # Pages derive tables through st.session_state; a fresh frame per run keeps those caches cold
+    for name, function in page_functions.items():
+        cases[name] = function if isinstance(function, Exception) else (function, clean.copy)
+    return cases
+
+
+def check_cube(jobs):
+    """
+    Check that cube rollups agree with counting the rows directly
+
+    Raises:
+        AssertionError: If a skill slice rolled up by country loses or miscounts postings
+    """
+    skill_table = importer.DataImport.build_skill_table(jobs)
+    cube = AggregateCube.from_jobs(jobs, skill_table)
+    skill = skill_table["skill"].value_counts().index[0]
+    expected = jobs.loc[skill_table.loc[skill_table["skill"] == skill, "job_id"], "country"].value_counts()
+    by_country = cube.slice(skill=skill).totals(["country"]).set_index("country")["postings"]
+    assert not by_country.empty, f"cube.slice(skill={skill!r}).totals(['country']) is empty"
+    assert by_country.sort_index().astype(int).equals(expected.sort_index().astype(int)), \
+        f"cube postings per country for {skill!r} do not match the rows"
+
+
+def run(sizes=SIZES, repeat=3, only=None):
+    """
+    Run every analytics benchmark at every size
+
+    Args:
+        sizes (list): Table sizes in rows
+        repeat (int): Timed runs per benchmark
+        only (list): Benchmark names to run (None runs all)
+
+    Returns:
+        list: One result dict per (benchmark, size)
+    """
+    results = []
+    page_functions = load_page_functions()
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in sizes:
+            raw = synthetic_raw_jobs(rows)
+            csv_path = os.path.join(tmp, f"jobs_{rows}.csv")
+            raw.to_csv(csv_path, index=False)
+            importer.DATA_URL = csv_path
+            if not only or "aggregate_cube" in only:
+                check_cube(importer.DataImport.clean_data(raw.copy()))
+
+            for name, case in benchmarks_for(raw, page_functions).items():
+                if only and name not in only:
+                    continue
+                result = {"benchmark": name, "rows": rows}
+                if isinstance(case, Exception):
+                    result["skipped"] = f"{type(case).__name__}: {case}"
+                else:
+                    result.update(measure(case[0], case[1], repeat))
+                results.append(result)
+                print(format_result(result), flush=True)
+    return results
+
+
+def metadata(label):
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "label": label or commit or datetime.now().strftime("%Y%m%d-%H%M%S"),
+        "commit": commit,
+        "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "cpus": os.cpu_count()
+    }
+
+
+def save_results(results, label=None, results_dir=RESULTS_DIR):
+    """Write results with run metadata to results_dir/<label>.json and return the path."""
+    run_info = metadata(label)
+    os.makedirs(results_dir, exist_ok=True)
+    path = os.path.join(results_dir, f"{run_info['label']}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"run": run_info, "results": results}, f, indent=2)
+    return path
+
+
+def compare(results, baseline_path, threshold=REGRESSION_THRESHOLD):
+    """
+    Print each benchmark's change against a stored run
+
+    Returns:
+        list: (benchmark, rows, ratio) of benchmarks slower than the threshold
+    """
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = {(r["benchmark"], r["rows"]): r for r in json.load(f)["results"] if "best_seconds" in r}
+
+    regressions = []
+    for result in results:
+        before = baseline.get((result["benchmark"], result["rows"]))
+        if before is None or "best_seconds" not in result:
+            continue
+        ratio = result["best_seconds"] / before["best_seconds"]
+        flag = "REGRESSION" if ratio > 1 + threshold else ""
+        print(f"{result['benchmark']:<24} {result['rows']:>9,} rows  {before['best_seconds']:.4f}s -> "
+              f"{result['best_seconds']:.4f}s  ({ratio:.2f}x)  peak {before['peak_mb']:.1f} -> {result['peak_mb']:.1f} MB  {flag}")
+        if flag:
+            regressions.append((result["benchmark"], result["rows"], ratio))
+    return regressions
+
+
+def format_result(result):
+    if "skipped" in result:
+        return f"{result['benchmark']:<24} {result['rows']:>9,} rows  skipped ({result['skipped']})"
+    return (f"{result['benchmark']:<24} {result['rows']:>9,} rows  best {result['best_seconds']:.4f}s  "
+            f"median {result['median_seconds']:.4f}s  peak {result['peak_mb']:.1f} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the analytics hot paths on synthetic job tables")
+    parser.add_argument("--sizes", default=",".join(str(size) for size in SIZES), help="Comma-separated row counts")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per benchmark")
+    parser.add_argument("--only", help="Comma-separated benchmark names to run")
+    parser.add_argument("--label", help="Name of the stored result file (defaults to the git commit)")
+    parser.add_argument("--compare", help="Stored result file to compare against")
+    parser.add_argument("--no-save", action="store_true", help="Do not store the results")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    only = args.only.split(",") if args.only else None
+    results = run(sizes, args.repeat, only)
+
+    if not args.no_save:
+        print(f"Saved results to {save_results(results, args.label)}")
+    if args.compare:
+        regressions = compare(results, args.compare)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""
+Throughput benchmarks for serp_api against the recorded fixture pages.
+
+Measures parser throughput (pages/sec and jobs/sec per parser backend) and the
+end-to-end time of get_job_data, get_technology_trends, get_skill_salary_data and
+build_composite_dataset against a local FakeSearchServer, so results do not
+depend on the network or on Google's rate limiting.
+
+    python -m benchmarks.bench_serp
+    python -m benchmarks.bench_serp --latency 0.2 --rate 10 --output bench_serp.json
+"""
+import io
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import contextlib
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import serp_api
+from modules.http_cache import ResponseCache
+from modules.rate_limiter import AdaptiveRateLimiter
+from benchmarks.fake_search import FakeSearchServer, load_fixtures
+
+BUILD_ROLES = ["Data Scientist", "Software Engineer", "Data Engineer", "DevOps Engineer", "Data Analyst"]
+BUILD_LOCATIONS = ["United States", "Remote", "London", "Seattle"]
+
+
+def quiet():
+    # serp_api reports progress with print; keep it out of the timings and the report
+    return contextlib.redirect_stdout(io.StringIO())
+
+
+def bench_parse(repeat=20):
+    """
+    Time parse_job_results on every job fixture with every available backend
+
+    Args:
+        repeat (int): Parses per fixture and backend
+
+    Returns:
+        list: One result dict per (backend, fixture)
+    """
+    fixtures = {name: body.decode("utf-8") for name, body in load_fixtures().items() if name.startswith("jobs_")}
+    results = []
+    for backend in serp_api.JOB_PARSERS:
+        for name, html in fixtures.items():
+            with quiet():
+                jobs = len(serp_api.parse_job_results(html, parser=backend))
+                start = time.perf_counter()
+                for _ in range(repeat):
+                    serp_api.parse_job_results(html, parser=backend)
+                elapsed = time.perf_counter() - start
+            results.append({
+                "benchmark": "parse",
+                "backend": backend,
+                "fixture": name,
+                "pages_per_sec": repeat / elapsed,
+                "jobs_per_sec": repeat * jobs / elapsed,
+                "seconds_per_page": elapsed / repeat
+            })
+    return results
+
+
+def bench_fetch(server, skills=8):
+    """Time the single-search fetch functions end to end against the fake server."""
+    results = []
+    cases = [
+        ("get_job_data", lambda: serp_api.get_job_data("data scientist", limit=20)),
+        ("get_technology_trends", lambda: serp_api.get_technology_trends()),
+        ("get_skill_salary_data", lambda: serp_api.get_skill_salary_data(
+            ["python", "java", "javascript", "sql", "aws", "docker", "kubernetes", "go"][:skills]))
+    ]
+    for name, call in cases:
+        requests_before = server.requests
+        with quiet():
+            start = time.perf_counter()
+            rows = len(call())
+            elapsed = time.perf_counter() - start
+        results.append({
+            "benchmark": "fetch",
+            "function": name,
+            "seconds": elapsed,
+            "rows": rows,
+            "requests": server.requests - requests_before
+        })
+    return results
+
+
+def bench_build(server, roles=BUILD_ROLES, locations=BUILD_LOCATIONS, concurrency=4):
+    """Time a full build_composite_dataset into a throwaway dataset directory."""
+    with tempfile.TemporaryDirectory() as tmp:
+        requests_before = server.requests
+        with quiet():
+            start = time.perf_counter()
+            df = serp_api.build_composite_dataset(
+                roles, locations, concurrency=concurrency, resume=False,
+                checkpoint_dir=os.path.join(tmp, "build"), dataset_dir=os.path.join(tmp, "jobs")
+            )
+            elapsed = time.perf_counter() - start
+    searches = len(roles) * len(locations)
+    return [{
+        "benchmark": "build",
+        "function": "build_composite_dataset",
+        "searches": searches,
+        "rows": len(df),
+        "requests": server.requests - requests_before,
+        "throttled": server.throttled,
+        "seconds": elapsed,
+        "pages_per_sec": searches / elapsed
+    }]
+
+
+def run(repeat=20, latency=0.0, rate=50.0, concurrency=4, throttle_every=0):
+    """
+    Run every serp_api benchmark
+
+    Args:
+        repeat (int): Parses per fixture for the parser benchmark
+        latency (float): Seconds the fake server adds to every response
+        rate (float): Requests per second allowed by the rate limiter
+        concurrency (int): Requests in flight during the build
+        throttle_every (int): Have the server answer every n-th request with 429
+
+    Returns:
+        list: Result dicts
+    """
+    results = bench_parse(repeat)
+
+    # Point serp_api at the fake server with no response cache and a fixed, known rate;
+    # the disabled cache gets its own directory so nothing touches the user's data/cache/http
+    saved = serp_api.SEARCH_URL, serp_api.RESPONSE_CACHE, serp_api.RATE_LIMITER
+    serp_api.RATE_LIMITER = AdaptiveRateLimiter(rate=rate, max_rate=rate, burst=concurrency)
+    try:
+        with tempfile.TemporaryDirectory() as cache_dir, \
+                FakeSearchServer(latency=latency, throttle_every=throttle_every, retry_after=0) as server:
+            serp_api.RESPONSE_CACHE = ResponseCache(ttl=0, cache_dir=cache_dir)
+            serp_api.SEARCH_URL = server.url
+            results += bench_fetch(server)
+            results += bench_build(server, concurrency=concurrency)
+    finally:
+        serp_api.SEARCH_URL, serp_api.RESPONSE_CACHE, serp_api.RATE_LIMITER = saved
+    return results
+
+
+def report(results):
+    for result in results:
+        label = " ".join(str(result[key]) for key in ("benchmark", "backend", "fixture", "function") if key in result)
+        metrics = ", ".join(
+            f"{key}={value:.4g}" if isinstance(value, float) else f"{key}={value}"
+            for key, value in result.items()
+            if key not in ("benchmark", "backend", "fixture", "function")
+        )
+        print(f"{label:<50} {metrics}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark serp_api parsing and fetching offline")
+    parser.add_argument("--repeat", type=int, default=20, help="Parses per fixture and backend")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every fake response")
+    parser.add_argument("--rate", type=float, default=50.0, help="Requests per second allowed by the rate limiter")
+    parser.add_argument("--concurrency", type=int, default=4, help="Requests in flight during the build")
+    parser.add_argument("--throttle-every", type=int, default=0, help="Answer every n-th request with 429")
+    parser.add_argument("--output", help="Also write the results to this JSON file")
+    args = parser.parse_args()
+
+    results = run(args.repeat, args.latency, args.rate, args.concurrency, args.throttle_every)
+    report(results)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+Local stand-in for the Google search endpoint used by serp_api.
+
+Replays the recorded pages in benchmarks/fixtures/serp so parsing, the fetch
+engine and dataset builds can be exercised without network access:
+
+    with FakeSearchServer() as server:
+        serp_api.SEARCH_URL = server.url
+        serp_api.get_job_data("data scientist")
+
+Run directly to serve the fixtures until interrupted:
+
+    python -m benchmarks.fake_search --port 8765
+"""
+import os
+import time
+import zlib
+import argparse
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "serp")
+
+# Job searches rotate through these pages so both card layouts are exercised
+JOB_PAGES = ["jobs_primary.html", "jobs_primary_large.html", "jobs_alternative.html"]
+
+
+def load_fixtures(fixtures_dir=FIXTURES_DIR):
+    """Return {filename: bytes} for every recorded page."""
+    fixtures = {}
+    for name in sorted(os.listdir(fixtures_dir)):
+        if name.endswith(".html"):
+            with open(os.path.join(fixtures_dir, name), "rb") as f:
+                fixtures[name] = f.read()
+    return fixtures
+
+
+def fixture_for(params):
+    """
+    Pick the recorded page answering a search
+
+    Args:
+        params (dict): Query string parameters (single values)
+
+    Returns:
+        str: Fixture filename
+    """
+    query = params.get("q", "")
+    if params.get("tbm") == "nws":
+        return "news.html"
+    if params.get("tbm") == "jobs":
+        # Stable choice per query so repeated runs see the same pages
+        return JOB_PAGES[zlib.crc32(query.encode("utf-8")) % len(JOB_PAGES)]
+    if "salary" in query.lower():
+        return "salary.html"
+    return "jobs_empty.html"
+
+
+class FakeSearchServer(object):
+    """
+    Threaded HTTP server replaying fixture pages on /search.
+    `latency` adds a fixed delay per response to model network round trips, and
+    `throttle_every` answers every n-th request with 429 + Retry-After so the
+    rate limiter's back-off path can be measured too.
+    """
+    def __init__(self, host="127.0.0.1", port=0, latency=0.0, throttle_every=0, retry_after=1,
+                 fixtures_dir=FIXTURES_DIR):
+        self.fixtures = load_fixtures(fixtures_dir)
+        self.latency = latency
+        self.throttle_every = throttle_every
+        self.retry_after = retry_after
+        self.requests = 0
+        self.throttled = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/search"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def _next_request(self):
+        # Returns True when this request should be throttled
+        with self._lock:
+            self.requests += 1
+            throttle = bool(self.throttle_every) and self.requests % self.throttle_every == 0
+            if throttle:
+                self.throttled += 1
+            return throttle
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive, like the real endpoint
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                if url.path != "/search":
+                    self._send(404, b"")
+                    return
+                if server.latency:
+                    time.sleep(server.latency)
+                if server._next_request():
+                    self._send(429, b"", {"Retry-After": str(server.retry_after)})
+                    return
+                params = {key: values[0] for key, values in parse_qs(url.query).items()}
+                self._send(200, server.fixtures[fixture_for(params)], {"Content-Type": "text/html; charset=UTF-8"})
+
+            def _send(self, status, body, headers=None):
+                self.send_response(status)
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve recorded search pages on /search")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response")
+    parser.add_argument("--throttle-every", type=int, default=0, help="Answer every n-th request with 429")
+    args = parser.parse_args()
+
+    server = FakeSearchServer(port=args.port, latency=args.latency, throttle_every=args.throttle_every)
+    print(f"Serving {len(server.fixtures)} fixtures at {server.url}")
+    try:
+        server._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._server.server_close()
+
+
+if __name__ == "__main__":
+    main()
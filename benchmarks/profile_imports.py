@@ -0,0 +1,140 @@
+"""
+Import-time profile of every Streamlit page.
+
+Each page's module-level imports are replayed in a fresh interpreter under
+`python -X importtime`, so the report shows the cold-start cost a new server
+process pays before the page can render, broken down by the top-level imports
+that dominate it. Libraries bound through modules.lazy.lazy_import are not
+imported here, which is the point: they only cost time when their feature runs.
+
+    python -m benchmarks.profile_imports
+    python -m benchmarks.profile_imports --budget 1.5 --top 5
+
+With --budget, the script exits 1 if any page's imports take longer than that
+many seconds.
+"""
+import os
+import re
+import ast
+import sys
+import glob
+import json
+import argparse
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+IMPORT_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def page_paths():
+    return [os.path.join(ROOT, "01_🖥️_Dashboard.py")] + sorted(glob.glob(os.path.join(ROOT, "pages", "*.py")))
+
+
+def module_imports(path):
+    """
+    Return the page's module-level import statements as source lines
+
+    Imports nested in try/except blocks at module level are included; imports
+    inside functions are not, since they only run when the function does.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+
+    statements = []
+    pending = list(tree.body)
+    while pending:
+        node = pending.pop(0)
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            statements.append(ast.unparse(node))
+        elif isinstance(node, ast.Try):
+            pending[:0] = node.body
+        elif isinstance(node, (ast.If, ast.With)):
+            pending[:0] = node.body
+    return statements
+
+
+def import_script(statements):
+    # Each import runs on its own so one missing dependency does not hide the rest
+    lines = ["import json", "missing = []"]
+    for statement in statements:
+        lines += ["try:", f"    {statement}", "except Exception as e:", "    missing.append(f'{type(e).__name__}: {e}')"]
+    lines.append("print(json.dumps(missing))")
+    return "\n".join(lines)
+
+
+def top_level_imports(stderr):
+    # Top-level entries (one space of indentation) hold the cumulative time of everything below them
+    imports = {}
+    for line in stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if match and len(match.group(3)) == 1:
+            imports[match.group(4)] = imports.get(match.group(4), 0) + int(match.group(2)) / 1e6
+    return imports
+
+
+def startup_imports():
+    """Return the modules every interpreter imports before a page's imports run."""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", import_script([])],
+                            capture_output=True, text=True)
+    return set(top_level_imports(result.stderr))
+
+
+def profile_page(path, baseline=()):
+    """
+    Replay a page's imports in a fresh interpreter
+
+    Args:
+        path (str): Page script
+        baseline (set): Interpreter startup imports to leave out of the totals
+
+    Returns:
+        dict: total seconds, the top-level imports with their cumulative seconds, and failed imports
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", import_script(module_imports(path))],
+                            cwd=ROOT, capture_output=True, text=True, env={**os.environ, "PYTHONPATH": ROOT})
+    imports = {name: seconds for name, seconds in top_level_imports(result.stderr).items() if name not in baseline}
+    try:
+        missing = json.loads(result.stdout.strip().splitlines()[-1])
+    except (IndexError, ValueError):
+        missing = [result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "interpreter failed"]
+    return {
+        "page": os.path.relpath(path, ROOT),
+        "total_seconds": sum(imports.values()),
+        "imports": dict(sorted(imports.items(), key=lambda item: item[1], reverse=True)),
+        "missing": missing
+    }
+
+
+def report(profiles, top=8):
+    for profile in profiles:
+        print(f"{profile['page']:<34} {profile['total_seconds']:.3f}s")
+        for name, seconds in list(profile["imports"].items())[:top]:
+            print(f"    {name:<32} {seconds:.3f}s")
+        for error in profile["missing"]:
+            print(f"    not installed: {error}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Profile the module-level import time of every page")
+    parser.add_argument("--top", type=int, default=8, help="Heaviest imports to list per page")
+    parser.add_argument("--budget", type=float, help="Fail if a page's imports take longer than this many seconds")
+    parser.add_argument("--json", action="store_true", help="Print the profiles as JSON")
+    args = parser.parse_args()
+
+    baseline = startup_imports()
+    profiles = [profile_page(path, baseline) for path in page_paths()]
+    if args.json:
+        print(json.dumps(profiles, indent=2))
+    else:
+        report(profiles, args.top)
+
+    if args.budget is not None:
+        over = [profile for profile in profiles if profile["total_seconds"] > args.budget]
+        for profile in over:
+            print(f"Over budget: {profile['page']} imports take {profile['total_seconds']:.3f}s (budget {args.budget:.3f}s)")
+        if over:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+import os
+import re
+import json
+import shutil
+import hashlib
+from datetime import date, datetime
+
+from modules.dataset_store import PartitionedDataset
+
+# Default directory for resumable composite dataset builds
+BUILD_DIR = os.path.join("data", "build")
+
+
+class BuildCheckpoint(object):
+    """
+    Persist each (role, location) slice of a composite dataset build as soon as it
+    completes, plus a manifest of finished slices. Each slice replaces its partition
+    of a PartitionedDataset, so the build output is the dataset itself. The manifest
+    belongs to one fetch date: a restarted build on the same day skips slices already
+    in it (including searches that found nothing), while a build on a later day starts
+    a fresh manifest. load() can read the partial dataset at any time, including from
+    another process while the build is still running.
+    """
+    def __init__(self, build_dir=BUILD_DIR, store=None, fetch_date=None):
+        self.build_dir = build_dir
+        self.store = store if store is not None else PartitionedDataset()
+        self.fetch_date = fetch_date or date.today()  # partition date of every slice in this build
+        self.manifest_path = os.path.join(build_dir, "manifest.json")
+        self.manifest = self._read_manifest()
+
+    @staticmethod
+    def slice_id(role, location):
+        """Return a filesystem-safe id for a (role, location) slice."""
+        slug = re.sub(r"[^a-z0-9]+", "-", f"{role}--{location}".lower()).strip("-")
+        digest = hashlib.sha1(f"{role}\0{location}".encode("utf-8")).hexdigest()[:8]
+        return f"{slug}-{digest}"
+
+    def is_done(self, role, location):
+        return BuildCheckpoint.slice_id(role, location) in self.manifest["slices"]
+
+    def save_slice(self, role, location, df):
+        """
+        Write one completed slice and record it in the manifest
+
+        Args:
+            role (str): Search role of the slice
+            location (str): Search location of the slice
+            df (pd.DataFrame): Parsed job rows for the slice; an empty frame marks the
+                slice done and clears any rows an earlier run wrote for it
+        """
+        slice_id = BuildCheckpoint.slice_id(role, location)
+        path = self.store.replace(df, role, location, self.fetch_date)
+
+        os.makedirs(self.build_dir, exist_ok=True)
+        self.manifest["slices"][slice_id] = {
+            "role": role,
+            "location": location,
+            "rows": len(df),
+            "file": os.path.relpath(path, self.store.root) if path else None,
+            "completed_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        }
+        self._write_manifest()
+
+    def completed(self):
+        """Return the manifest entries of finished slices."""
+        return list(self.manifest["slices"].values())
+
+    def load(self, pairs=None):
+        """
+        Load finished slices
+
+        Args:
+            pairs (list): (role, location) pairs to load; None loads every finished slice
+
+        Returns:
+            pd.DataFrame: Combined rows of the finished slices (empty if none)
+        """
+        self.manifest = self._read_manifest()
+        entries = self.manifest["slices"]
+        if pairs is not None:
+            wanted = {BuildCheckpoint.slice_id(role, location) for role, location in pairs}
+            entries = {slice_id: entry for slice_id, entry in entries.items() if slice_id in wanted}
+        files = [os.path.join(self.store.root, entry["file"]) for entry in entries.values() if entry["file"]]
+        return self.store.read(files=files)
+
+    def reset(self):
+        """Forget all finished slices so the next build fetches them again; each refetched slice replaces its partition."""
+        if os.path.isdir(self.build_dir):
+            shutil.rmtree(self.build_dir)
+        self.manifest = self._read_manifest()
+
+    def _read_manifest(self):
+        # A manifest left by a build on another day is ignored and overwritten by the first saved slice
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+            if manifest.get("fetch_date") == str(self.fetch_date):
+                return manifest
+        except (OSError, ValueError):
+            pass
+        return {"fetch_date": str(self.fetch_date), "slices": {}}
+
+    def _write_manifest(self):
+        # Written to a temp file and renamed so readers never see a half-written manifest
+        tmp_path = self.manifest_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.manifest, f, indent=2)
+        os.replace(tmp_path, self.manifest_path)
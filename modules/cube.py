@@ -0,0 +1,211 @@
+import numpy as np
+import pandas as pd
+
+# Dimensions of every cube cell; "period" is the posting's calendar month (YYYY-MM)
+DIMENSIONS = ["country", "skill", "period", "experience_level", "via"]
+MEASURES = ["postings", "salary_count", "salary_sum", "salary_sumsq"]
+
+# Cells with skill == ALL_SKILLS count each posting once, whatever its skills
+ALL_SKILLS = "*"
+UNKNOWN = "Unknown"
+
+# Log-spaced salary histogram bins (about 3.7% wide) used as a mergeable quantile sketch
+SKETCH_EDGES = np.geomspace(1e4, 1e6, 129)
+
+
+class AggregateCube(object):
+    """
+    Pre-aggregated postings over country x skill x period x experience_level x via.
+    Each cell stores the number of postings, the count, sum and sum of squares of
+    their salaries, and a salary histogram, so filters are answered by slicing a
+    table of cells instead of scanning postings. Cells whose skill is ALL_SKILLS
+    hold the per-posting totals; the other cells hold one entry per skill mention.
+    """
+    def __init__(self, cells, sketch):
+        self.cells = cells  # DIMENSIONS + MEASURES, one row per non-empty cell
+        self.sketch = sketch  # DIMENSIONS + ["bin", "count"], salaried postings only
+
+    @classmethod
+    def from_jobs(cls, jobs_data, skill_table, salary_col=None):
+        """
+        Build the cube from the postings table
+
+        Args:
+            jobs_data (pd.DataFrame): Cleaned postings
+            skill_table (pd.DataFrame): Table from DataImport.build_skill_table
+            salary_col (str): Salary column (defaults to salary_yearly, then salary)
+
+        Returns:
+            AggregateCube: Cube over every posting
+        """
+        # Every dimension is factorized to integer codes; skill code 0 is ALL_SKILLS
+        columns = {}
+        for dimension in ["country", "experience_level", "via"]:
+            values = jobs_data[dimension] if dimension in jobs_data.columns else pd.Series(UNKNOWN, index=jobs_data.index)
+            columns[dimension] = pd.factorize(values.astype(object).where(values.notna(), UNKNOWN))
+        columns["period"] = pd.factorize(AggregateCube.posting_periods(jobs_data))
+
+        positions = jobs_data.index.get_indexer(skill_table["job_id"])
+        found = positions >= 0
+        skill_codes, skills = pd.factorize(skill_table["skill"].to_numpy()[found])
+        columns["skill"] = (None, pd.Index([ALL_SKILLS]).append(pd.Index(skills)))
+
+        if salary_col is None:
+            salary_col = next((col for col in ["salary_yearly", "salary"] if col in jobs_data.columns), None)
+        salary = (pd.to_numeric(jobs_data[salary_col], errors="coerce").to_numpy(dtype=float)
+                  if salary_col else np.full(len(jobs_data), np.nan))
+
+        # Per-posting rows under ALL_SKILLS, plus one row per (posting, skill) mention
+        rows = np.concatenate([np.arange(len(jobs_data)), positions[found]])
+        row_skills = np.concatenate([np.zeros(len(jobs_data), dtype=np.int64), skill_codes + 1])
+
+        # Encode each row's cell as one mixed-radix integer and aggregate with bincount
+        sizes = [len(columns[dimension][1]) for dimension in DIMENSIONS]
+        key = np.zeros(len(rows), dtype=np.int64)
+        for dimension, size in zip(DIMENSIONS, sizes):
+            codes = row_skills if dimension == "skill" else columns[dimension][0][rows]
+            key = key * size + codes
+        cell_of_row, cell_keys = pd.factorize(key)
+        row_salary = salary[rows]
+        salaried = ~np.isnan(row_salary)
+        paid = np.where(salaried, row_salary, 0.0)
+
+        cells = AggregateCube._decode(cell_keys, sizes, columns)
+        cells["postings"] = np.bincount(cell_of_row, minlength=len(cell_keys))
+        cells["salary_count"] = np.bincount(cell_of_row, weights=salaried, minlength=len(cell_keys)).astype(np.int64)
+        cells["salary_sum"] = np.bincount(cell_of_row, weights=paid, minlength=len(cell_keys))
+        cells["salary_sumsq"] = np.bincount(cell_of_row, weights=paid ** 2, minlength=len(cell_keys))
+
+        bins = len(SKETCH_EDGES) - 1
+        sketch_key = key[salaried] * bins + AggregateCube.salary_bins(row_salary[salaried])
+        bucket_of_row, sketch_keys = pd.factorize(sketch_key)
+        sketch = AggregateCube._decode(sketch_keys // bins, sizes, columns)
+        sketch["bin"] = sketch_keys % bins
+        sketch["count"] = np.bincount(bucket_of_row, minlength=len(sketch_keys))
+        return cls(cells, sketch)
+
+    @staticmethod
+    def _decode(keys, sizes, columns):
+        # Split mixed-radix cell keys back into one labelled column per dimension
+        decoded = {}
+        for dimension, size in reversed(list(zip(DIMENSIONS, sizes))):
+            keys, codes = np.divmod(keys, size)
+            decoded[dimension] = columns[dimension][1].take(codes)
+        return pd.DataFrame({dimension: np.asarray(decoded[dimension], dtype=object) for dimension in DIMENSIONS})
+
+    @staticmethod
+    def posting_periods(jobs_data):
+        """Return each posting's calendar month, or UNKNOWN when its date cannot be parsed."""
+        date_col = next((col for col in ["posted_at", "date_time"] if col in jobs_data.columns), None)
+        if date_col is None:
+            return pd.Series(UNKNOWN, index=jobs_data.index, dtype=object)
+        dates = pd.to_datetime(jobs_data[date_col], errors="coerce")
+        # Format each distinct month once rather than every row
+        months = (dates.dt.year * 12 + dates.dt.month - 1).fillna(-1).astype(np.int64)
+        codes, uniques = pd.factorize(months)
+        labels = np.array([f"{month // 12}-{month % 12 + 1:02d}" if month >= 0 else UNKNOWN for month in uniques],
+                          dtype=object)
+        return pd.Series(labels[codes], index=jobs_data.index, dtype=object)
+
+    @staticmethod
+    def salary_bins(salaries):
+        return np.clip(np.searchsorted(SKETCH_EDGES, salaries, side="right") - 1, 0, len(SKETCH_EDGES) - 2)
+
+    def __len__(self):
+        return len(self.cells)
+
+    def values(self, dimension):
+        """Return the distinct values of a dimension (ALL_SKILLS excluded)."""
+        values = self.cells[dimension].unique()
+        return sorted(value for value in values if value != ALL_SKILLS)
+
+    def slice(self, **filters):
+        """
+        Keep the cells matching every filter
+
+        Args:
+            **filters: dimension=value or dimension=[values]; None leaves a dimension unfiltered
+
+        Returns:
+            AggregateCube: Cube over the matching cells
+        """
+        cells, sketch = self.cells, self.sketch
+        for dimension, values in filters.items():
+            if values is None:
+                continue
+            if dimension not in DIMENSIONS:
+                raise ValueError(f"Unknown cube dimension: {dimension}")
+            values = [values] if isinstance(values, str) or not hasattr(values, "__iter__") else list(values)
+            cells = cells[cells[dimension].isin(values)]
+            sketch = sketch[sketch[dimension].isin(values)]
+        return AggregateCube(cells, sketch)
+
+    def totals(self, by=()):
+        """
+        Roll the cube up to the given dimensions
+
+        Without "skill" in by, only the per-posting ALL_SKILLS cells are summed so
+        postings are counted once; with it, the ALL_SKILLS cells are left out.
+        A cube sliced to particular skills has no ALL_SKILLS cells, so its totals
+        are summed from the skill cells (exact for a single skill).
+
+        Args:
+            by (list): Dimensions to keep
+
+        Returns:
+            pd.DataFrame: postings, salary_count, salary_mean and salary_std per group
+        """
+        by = list(by)
+        cells = self._skill_cells("skill" in by, self.cells)
+        if by:
+            totals = cells.groupby(by, sort=False, observed=True)[MEASURES].sum().reset_index()
+        else:
+            totals = cells[MEASURES].sum().to_frame().T
+        count = totals["salary_count"].replace(0, np.nan)
+        totals["salary_mean"] = totals["salary_sum"] / count
+        variance = (totals["salary_sumsq"] / count - totals["salary_mean"] ** 2).clip(lower=0)
+        totals["salary_std"] = np.sqrt(variance)
+        return totals
+
+    def quantile(self, q, by=()):
+        """
+        Approximate salary quantile from the histogram sketch
+
+        Args:
+            q (float): Quantile in [0, 1], e.g. 0.5 for the median
+            by (list): Dimensions to group by (same skill rules as totals)
+
+        Returns:
+            pd.Series: Quantile per group (a single value when by is empty)
+        """
+        by = list(by)
+        sketch = self._skill_cells("skill" in by, self.sketch)
+        histograms = sketch.groupby(by + ["bin"], sort=False, observed=True)["count"].sum()
+        if by:
+            return histograms.groupby(level=by, sort=False).apply(
+                lambda h: AggregateCube._histogram_quantile(h.droplevel(by), q)
+            )
+        return AggregateCube._histogram_quantile(histograms, q)
+
+    @staticmethod
+    def _skill_cells(per_skill, frame):
+        is_total = frame["skill"] == ALL_SKILLS
+        # slice(skill=...) drops the ALL_SKILLS cells; fall back to the skill cells rather than nothing
+        if per_skill or not is_total.any():
+            return frame[~is_total]
+        return frame[is_total]
+
+    @staticmethod
+    def _histogram_quantile(histogram, q):
+        if histogram.empty:
+            return np.nan
+        histogram = histogram.sort_index()
+        counts = histogram.to_numpy(dtype=float)
+        cumulative = np.cumsum(counts)
+        target = q * cumulative[-1]
+        i = min(int(np.searchsorted(cumulative, target)), len(counts) - 1)
+        # Interpolate geometrically inside the bin holding the target rank
+        low, high = SKETCH_EDGES[histogram.index[i]], SKETCH_EDGES[histogram.index[i] + 1]
+        before = cumulative[i] - counts[i]
+        fraction = (target - before) / counts[i] if counts[i] else 0.5
+        return float(low * (high / low) ** fraction)
@@ -0,0 +1,180 @@
+import os
+import uuid
+from datetime import date, datetime
+from urllib.parse import quote
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from modules.snapshot import Snapshot
+
+# Default root of the partitioned jobs dataset written by composite builds
+DATASET_DIR = os.path.join("data", "jobs")
+
+# Hive-style directory levels: search_role=<role>/search_location=<location>/fetch_date=<YYYY-MM-DD>
+PARTITION_SCHEMA = pa.schema([
+    ("search_role", pa.string()),
+    ("search_location", pa.string()),
+    ("fetch_date", pa.string())
+])
+
+
+class PartitionedDataset(object):
+    """
+    Append-only Parquet dataset partitioned by search role, search location and fetch date.
+    Every batch becomes its own part file, so writers never rewrite or hold earlier data,
+    and readers only open the partitions that match their filters.
+    """
+    def __init__(self, root=DATASET_DIR):
+        self.root = root
+        self.partitioning = ds.partitioning(PARTITION_SCHEMA, flavor="hive")
+
+    def partition_dir(self, role, location, fetch_date=None):
+        """Return the directory holding one (role, location, fetch date) partition."""
+        values = (role, location, PartitionedDataset._date_key(fetch_date or date.today()))
+        # Values are URI-encoded so roles like "UI/UX Designer" stay one path segment
+        parts = [f"{field.name}={quote(str(value), safe='')}" for field, value in zip(PARTITION_SCHEMA, values)]
+        return os.path.join(self.root, *parts)
+
+    def append(self, df, role, location, fetch_date=None):
+        """
+        Write one batch as a new part file
+
+        Args:
+            df (pd.DataFrame): Job rows of the batch
+            role (str): Search role of the batch
+            location (str): Search location of the batch
+            fetch_date (date): Partition date (defaults to today)
+
+        Returns:
+            str: Path of the written file
+        """
+        directory = self.partition_dir(role, location, fetch_date)
+        os.makedirs(directory, exist_ok=True)
+        filename = f"part-{datetime.now().strftime('%H%M%S')}-{uuid.uuid4().hex[:8]}.parquet"
+        path = os.path.join(directory, filename)
+
+        # Partition values live in the path, not in the file
+        table = pa.Table.from_pandas(df.drop(columns=PARTITION_SCHEMA.names, errors="ignore"), preserve_index=False)
+        # Dot-prefixed temp files are skipped by readers scanning the dataset mid-build
+        tmp_path = os.path.join(directory, f".{filename}.tmp")
+        pq.write_table(table, tmp_path)
+        os.replace(tmp_path, path)
+        return path
+
+    def replace(self, df, role, location, fetch_date=None):
+        """
+        Write one batch as the only part file of its partition
+
+        The new file is written before the old ones are removed, so a re-fetched
+        (role, location, fetch date) slice never shows up twice and readers never find
+        the partition empty while it is rewritten.
+
+        Args:
+            df (pd.DataFrame): Job rows of the batch; an empty frame just clears the partition
+            role (str): Search role of the batch
+            location (str): Search location of the batch
+            fetch_date (date): Partition date (defaults to today)
+
+        Returns:
+            str: Path of the written file, or None if df is empty
+        """
+        directory = self.partition_dir(role, location, fetch_date)
+        old_files = PartitionedDataset._part_files(directory)
+        path = self.append(df, role, location, fetch_date) if not df.empty else None
+        for old_path in old_files:
+            try:
+                os.remove(old_path)
+            except FileNotFoundError:
+                continue
+        return path
+
+    def read(self, roles=None, locations=None, since=None, until=None, columns=None, files=None):
+        """
+        Load the rows of matching partitions
+
+        Args:
+            roles (list): Search roles to keep (None keeps all)
+            locations (list): Search locations to keep (None keeps all)
+            since (date): Earliest fetch date to keep
+            until (date): Latest fetch date to keep
+            columns (list): Data columns to read (None reads all)
+            files (list): Restrict reading to these part files
+
+        Returns:
+            pd.DataFrame: Matching rows with search_role, search_location and fetch_date columns
+        """
+        tables = [
+            self._with_partition_columns(fragment, columns)
+            for fragment in self.fragments(roles, locations, since, until, files)
+        ]
+        if not tables:
+            return pd.DataFrame()
+        # Batches can disagree on types (e.g. an all-null salary column), so promote to a common schema
+        return Snapshot.table_to_frame(pa.concat_tables(tables, promote_options="permissive"))
+
+    def fragments(self, roles=None, locations=None, since=None, until=None, files=None):
+        """Return the part files matching the filters; pruning uses directory names only."""
+        if files is not None:
+            files = [path for path in files if os.path.exists(path)]
+            if not files:
+                return []
+            dataset = ds.dataset(files, format="parquet", partitioning=self.partitioning,
+                                 partition_base_dir=self.root)
+        elif os.path.isdir(self.root):
+            dataset = ds.dataset(self.root, format="parquet", partitioning=self.partitioning,
+                                 exclude_invalid_files=False, ignore_prefixes=[".", "_"])
+        else:
+            return []
+        return list(dataset.get_fragments(filter=PartitionedDataset._filter(roles, locations, since, until)))
+
+    def partitions(self):
+        """
+        Returns:
+            list: (role, location, fetch_date) of every partition holding at least one file
+        """
+        keys = {
+            tuple(ds.get_partition_keys(fragment.partition_expression).get(name) for name in PARTITION_SCHEMA.names)
+            for fragment in self.fragments()
+        }
+        return sorted(keys)
+
+    @staticmethod
+    def _part_files(directory):
+        if not os.path.isdir(directory):
+            return []
+        return [os.path.join(directory, name) for name in os.listdir(directory)
+                if name.endswith(".parquet") and not name.startswith(".")]
+
+    @staticmethod
+    def _filter(roles, locations, since, until):
+        conditions = []
+        if roles is not None:
+            conditions.append(ds.field("search_role").isin(list(roles)))
+        if locations is not None:
+            conditions.append(ds.field("search_location").isin(list(locations)))
+        # ISO dates compare correctly as strings
+        if since is not None:
+            conditions.append(ds.field("fetch_date") >= PartitionedDataset._date_key(since))
+        if until is not None:
+            conditions.append(ds.field("fetch_date") <= PartitionedDataset._date_key(until))
+        expression = None
+        for condition in conditions:
+            expression = condition if expression is None else expression & condition
+        return expression
+
+    @staticmethod
+    def _with_partition_columns(fragment, columns):
+        if columns is not None:
+            names = set(fragment.physical_schema.names)
+            columns = [column for column in columns if column in names]
+        table = fragment.to_table(columns=columns, schema=fragment.physical_schema)
+        keys = ds.get_partition_keys(fragment.partition_expression)
+        for name in PARTITION_SCHEMA.names:
+            table = table.append_column(name, pa.array([keys.get(name)] * table.num_rows, type=pa.string()))
+        return table
+
+    @staticmethod
+    def _date_key(value):
+        return value.strftime("%Y-%m-%d") if hasattr(value, "strftime") else str(value)
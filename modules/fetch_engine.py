@@ -0,0 +1,106 @@
+import asyncio
+import httpx
+
+from modules.http_client import RETRIES, BACKOFF_FACTOR, RETRY_STATUSES
+from modules.rate_limiter import AdaptiveRateLimiter, THROTTLE_STATUSES, retry_after_seconds
+
+
+class AsyncFetchEngine(object):
+    """
+    Fetch many GET requests concurrently with asyncio.
+    Up to `concurrency` requests are in flight at once under an adaptive per-host
+    rate limit (pass a shared AdaptiveRateLimiter to pace other callers too), and
+    results are handed back as they arrive rather than in request order.
+    An optional ResponseCache answers repeated requests without touching the network
+    (bodies are stored only when `cacheable(text)` is true, so error pages are fetched
+    again next time), and 429/5xx responses are retried with exponential backoff.
+    """
+    def __init__(self, concurrency=4, requests_per_second=0.5, timeout=30, headers=None, cache=None,
+                 retries=RETRIES, backoff_factor=BACKOFF_FACTOR, rate_limiter=None, cacheable=None):
+        self.concurrency = concurrency
+        # requests_per_second is only the starting rate of a private limiter
+        self.limiter = rate_limiter if rate_limiter is not None else AdaptiveRateLimiter(rate=requests_per_second)
+        self.timeout = timeout
+        self.headers = headers or {}
+        self.cache = cache
+        self.cacheable = cacheable
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+
+    async def fetch_iter(self, requests):
+        """
+        Fetch every request and yield results in completion order
+
+        Args:
+            requests (list): (key, url, params) tuples
+
+        Yields:
+            tuple: (key, text, error) where exactly one of text/error is None
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+        limits = httpx.Limits(max_connections=self.concurrency, max_keepalive_connections=self.concurrency)
+
+        async with httpx.AsyncClient(headers=self.headers, timeout=self.timeout, limits=limits,
+                                     follow_redirects=True) as client:
+            async def fetch(key, url, params):
+                # Cache files are read and written in a worker thread so gzip I/O never blocks the event loop
+                if self.cache is not None:
+                    text = await asyncio.to_thread(self.cache.get, url, params)
+                    if text is not None:
+                        return key, text, None
+                async with semaphore:
+                    # No limiter token is taken here: _get takes exactly one per HTTP attempt
+                    try:
+                        response = await self._get(client, url, params)
+                        response.raise_for_status()
+                    except Exception as e:
+                        return key, None, e
+                if self.cache is not None and (self.cacheable is None or self.cacheable(response.text)):
+                    await asyncio.to_thread(self.cache.set, url, params, response.text)
+                return key, response.text, None
+
+            tasks = [asyncio.ensure_future(fetch(*request)) for request in requests]
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    yield await next_done
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+    async def _get(self, client, url, params):
+        # Retry connection errors, 429 and 5xx with exponential backoff, honouring Retry-After
+        # Every attempt takes a limiter token, and each status is fed back to adapt the rate
+        for attempt in range(self.retries + 1):
+            await self.limiter.acquire_async(url)
+            delay = None
+            try:
+                response = await client.get(url, params=params)
+            except httpx.TransportError:
+                if attempt == self.retries:
+                    raise
+            else:
+                delay = retry_after_seconds(response.headers)
+                self.limiter.record(url, [response.status_code], delay)
+                if response.status_code not in RETRY_STATUSES or attempt == self.retries:
+                    return response
+                # A throttled response with Retry-After already holds the host in the limiter,
+                # so the next acquire_async does the waiting; sleeping here as well would wait twice
+                if delay is not None and response.status_code in THROTTLE_STATUSES:
+                    continue
+            await asyncio.sleep(delay if delay is not None else self.backoff_factor * (2 ** attempt))
+
+    async def fetch_all(self, requests, on_result):
+        """Call on_result(key, text, error) for every request as it completes."""
+        async for key, text, error in self.fetch_iter(requests):
+            on_result(key, text, error)
+
+    def run(self, requests, on_result):
+        """
+        Blocking wrapper around fetch_all for synchronous callers
+
+        Args:
+            requests (list): (key, url, params) tuples
+            on_result (callable): Called with (key, text, error) as each request completes
+        """
+        asyncio.run(self.fetch_all(requests, on_result))
+
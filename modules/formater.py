@@ -1,5 +1,20 @@
+import os
+import json
+import time
+import hashlib
 import streamlit as st
 
+from modules.lazy import lazy_import
+
+# Only needed the first time an animation is downloaded
+requests = lazy_import("requests")
+
+LOTTIE_TIMEOUT = 3  # seconds to wait for an animation before rendering the page without it
+LOTTIE_RETRY = 5*60  # seconds before a failed animation URL is tried again
+# Downloaded animations, reused by later processes. Same root as snapshot.CACHE_DIR, which
+# is not imported here because it pulls in pyarrow on pages that never read the dataset.
+LOTTIE_DIR = os.path.join("data", "cache", "lottie")
+
 class Title(object):
     """"
     Update title and favicon of each page
@@ -35,3 +50,90 @@ class Footer:
         </style>
         """
         st.markdown(footer_html, unsafe_allow_html=True)
+
+
+class Lottie(object):
+    """
+    Sidebar Lottie animations shared by every page.
+    Each animation is downloaded once and kept in memory for the process and on disk
+    for later processes, so reruns never wait on the animation host.
+    """
+    @staticmethod
+    def show(url, key, height=200):
+        """
+        Render an animation, or nothing if it (or streamlit_lottie) is unavailable
+
+        Args:
+            url (str): Lottie JSON URL
+            key (str): Streamlit widget key
+            height (int): Height in pixels
+        """
+        animation = Lottie.load(url)
+        if animation is None:
+            return
+        try:
+            from streamlit_lottie import st_lottie
+        except ImportError:
+            return
+        st_lottie(animation, height=height, key=key)
+
+    @staticmethod
+    def load(url, timeout=LOTTIE_TIMEOUT):
+        """
+        Return the animation JSON from memory, disk or the network, in that order
+
+        Args:
+            url (str): Lottie JSON URL
+            timeout (float): Seconds to wait for the download
+
+        Returns:
+            dict: Animation, or None if it could not be loaded
+        """
+        animations = Lottie._animations()
+        cached = animations.get(url)
+        if cached is not None and (cached[0] is not None or time.time() - cached[1] < LOTTIE_RETRY):
+            return cached[0]
+        animation = Lottie._read(url)
+        if animation is None:
+            animation = Lottie._download(url, timeout)
+        animations[url] = (animation, time.time())
+        return animation
+
+    @staticmethod
+    @st.cache_resource
+    def _animations():
+        # url -> (animation or None, time loaded), shared across sessions
+        return {}
+
+    @staticmethod
+    def path(url):
+        return os.path.join(LOTTIE_DIR, f"{hashlib.sha256(url.encode('utf-8')).hexdigest()[:16]}.json")
+
+    @staticmethod
+    def _read(url):
+        try:
+            with open(Lottie.path(url), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _download(url, timeout):
+        try:
+            response = requests.get(url, timeout=timeout)
+            response.raise_for_status()
+            animation = response.json()
+        except (requests.RequestException, ValueError) as e:
+            print(f"Error loading animation {url}: {str(e)}")
+            return None
+
+        path = Lottie.path(url)
+        try:
+            os.makedirs(LOTTIE_DIR, exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(animation, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Error saving animation {url}: {str(e)}")
+        return animation
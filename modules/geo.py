@@ -0,0 +1,122 @@
+import os
+import json
+import threading
+import pandas as pd
+import streamlit as st
+
+from modules.snapshot import CACHE_DIR
+
+# Natural Earth 1:110m admin-0 countries (public domain), simplified and rounded to 3 decimals.
+# Properties: ADMIN (country name), ISO_A3 and CONTINENT.
+WORLD_GEOJSON = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                             "assets", "world_countries_110m.geojson")
+
+# Raw country value -> {"name": English name, "iso_a3": ISO 3166 alpha-3 or null}, kept across runs
+COUNTRY_LOOKUP = os.path.join(CACHE_DIR, "country_names.json")
+
+# Common English names pycountry does not resolve (it only knows e.g. "Russian Federation"),
+# mapped to the ISO_A3 codes used by the bundled boundaries
+COUNTRY_ALIASES = {
+    "Brunei": "BRN", "Burma": "MMR", "Cape Verde": "CPV", "Democratic Republic of the Congo": "COD",
+    "East Timor": "TLS", "Ivory Coast": "CIV", "Kosovo": "XKX", "Macau": "MAC", "Macedonia": "MKD",
+    "North Korea": "PRK", "Palestine": "PSE", "Russia": "RUS", "South Korea": "KOR", "Swaziland": "SWZ",
+    "Turkey": "TUR", "UAE": "ARE", "UK": "GBR", "Vatican City": "VAT"
+}
+
+
+class WorldMap(object):
+    """
+    Country boundaries for the choropleth maps, read from the bundled GeoJSON
+    """
+    @staticmethod
+    @st.cache_resource
+    def boundaries(path=WORLD_GEOJSON):
+        """
+        Load the country boundaries once per process and share them across sessions
+
+        Args:
+            path (str): GeoJSON file to read
+
+        Returns:
+            gpd.GeoDataFrame: One row per country; treat it as read-only (merge returns a copy)
+        """
+        import geopandas as gpd
+        return gpd.read_file(path)
+
+
+class CountryNames(object):
+    """
+    Persistent lookup from raw country values to ISO alpha-3 codes (stored with the English name).
+    Each distinct raw value is resolved once, from COUNTRY_ALIASES or else with pycountry, and
+    stored in a JSON table, so columns are recoded with a vectorized map over the table instead
+    of a lookup per row. The table is shared by every session and only touched under its lock.
+    """
+    def __init__(self, path=COUNTRY_LOOKUP):
+        self.path = path
+        self.table = self._read()
+        self._lock = threading.Lock()
+
+    def resolve(self, values):
+        """
+        Add any raw values missing from the table, writing it back if it grew
+
+        Args:
+            values (iterable): Raw country values (duplicates and NaN are ignored)
+
+        Returns:
+            dict: A copy of the lookup table, safe to iterate while other sessions add to it
+        """
+        values = pd.unique(pd.Series(list(values), dtype=object).dropna())
+        with self._lock:
+            # Values stored unresolved before they were given an alias are looked up again
+            missing = {value for value in values
+                       if value not in self.table
+                       or (self.table[value]["iso_a3"] is None and value in COUNTRY_ALIASES)}
+            if not missing:
+                return dict(self.table)
+            try:
+                import pycountry
+            except ImportError:
+                # Without pycountry only aliases resolve, and nothing is stored
+                return {**self.table, **{value: {"name": value, "iso_a3": COUNTRY_ALIASES.get(value)} for value in missing}}
+
+            for value in missing:
+                if value in COUNTRY_ALIASES:
+                    self.table[value] = {"name": value, "iso_a3": COUNTRY_ALIASES[value]}
+                    continue
+                try:
+                    country = pycountry.countries.lookup(value)
+                    self.table[value] = {"name": country.name, "iso_a3": country.alpha_3}
+                except LookupError:
+                    self.table[value] = {"name": value, "iso_a3": None}
+            try:
+                self._write()
+            except OSError as e:
+                print(f"Error saving country lookup: {str(e)}")
+            return dict(self.table)
+
+    def iso_a3(self, countries):
+        """Map a column of raw country values to ISO alpha-3 codes (NaN when unresolved)."""
+        table = self.resolve(countries.unique())
+        return countries.map({value: entry["iso_a3"] for value, entry in table.items()})
+
+    def _read(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write(self):
+        # Written to a temp file and renamed so other processes never read a partial table
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.table, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+
+@st.cache_resource
+def country_names():
+    """Return the process-wide CountryNames lookup shared by every session."""
+    return CountryNames()
@@ -0,0 +1,99 @@
+import os
+import gzip
+import json
+import time
+import shutil
+import hashlib
+
+from modules.snapshot import CACHE_DIR
+
+
+class ResponseCache(object):
+    """
+    Content-addressed on-disk cache of HTTP response bodies.
+    Entries are keyed by a hash of the URL and query parameters, stored
+    gzip-compressed, and expire `ttl` seconds after they were written;
+    expired files are deleted when they are next read or by prune().
+    """
+    def __init__(self, ttl=6*60*60, cache_dir=os.path.join(CACHE_DIR, "http")):
+        self.ttl = ttl  # seconds; 0 disables the cache
+        self.cache_dir = cache_dir
+
+    @staticmethod
+    def key(url, params=None):
+        """Return the hex digest identifying a request."""
+        request = json.dumps({"url": url, "params": params or {}}, sort_keys=True, default=str)
+        return hashlib.sha256(request.encode("utf-8")).hexdigest()
+
+    def path(self, key):
+        # Fan out into subdirectories so no single directory grows too large
+        return os.path.join(self.cache_dir, key[:2], f"{key}.gz")
+
+    def get(self, url, params=None):
+        """
+        Return the cached body for a request
+
+        Args:
+            url (str): Request URL
+            params (dict): Query parameters
+
+        Returns:
+            str: Response body, or None if missing or expired
+        """
+        if not self.ttl:
+            return None
+        path = self.path(ResponseCache.key(url, params))
+        try:
+            if time.time() - os.path.getmtime(path) >= self.ttl:
+                os.remove(path)
+                return None
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                return f.read()
+        except (OSError, EOFError):
+            return None
+
+    def set(self, url, params, text):
+        """
+        Store a response body (written atomically)
+
+        Args:
+            url (str): Request URL
+            params (dict): Query parameters
+            text (str): Response body; empty bodies are not stored
+        """
+        if not self.ttl or not text:
+            return
+        path = self.path(ResponseCache.key(url, params))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+
+    def prune(self):
+        """
+        Delete expired entries, including temp files left by interrupted writes.
+        A disabled cache (ttl 0) leaves the directory alone, since its entries may
+        belong to a cache configured with a TTL elsewhere.
+
+        Returns:
+            int: Number of files removed
+        """
+        if not self.ttl or not os.path.isdir(self.cache_dir):
+            return 0
+        removed = 0
+        now = time.time()
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                path = os.path.join(root, name)
+                try:
+                    if now - os.path.getmtime(path) >= self.ttl:
+                        os.remove(path)
+                        removed += 1
+                except OSError:
+                    continue
+        return removed
+
+    def clear(self):
+        if os.path.isdir(self.cache_dir):
+            shutil.rmtree(self.cache_dir)
@@ -0,0 +1,113 @@
+import os
+import time
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from modules.rate_limiter import THROTTLE_STATUSES, retry_after_seconds
+
+# Defaults can be tuned per deployment through environment variables
+POOL_SIZE = int(os.getenv("HTTP_POOL_SIZE", 10))
+RETRIES = int(os.getenv("HTTP_RETRIES", 3))
+BACKOFF_FACTOR = float(os.getenv("HTTP_BACKOFF_FACTOR", 1.0))
+TIMEOUT = float(os.getenv("HTTP_TIMEOUT", 30))
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def build_session(pool_size=POOL_SIZE, retries=RETRIES, backoff_factor=BACKOFF_FACTOR):
+    """
+    Create a requests.Session with a keep-alive connection pool and retries
+
+    Only connection errors are retried by urllib3; 429 and 5xx responses are handed
+    back so get_with_limiter can retry them through the rate limiter.
+
+    Args:
+        pool_size (int): Connections kept open per host
+        retries (int): Retries on connection errors
+        backoff_factor (float): Exponential backoff base in seconds
+
+    Returns:
+        requests.Session: Configured session
+    """
+    retry = Retry(
+        total=retries,
+        status=0,
+        backoff_factor=backoff_factor,
+        allowed_methods=frozenset(["GET", "HEAD"]),
+        respect_retry_after_header=False,  # otherwise urllib3 retries 429/503 itself, bypassing the limiter
+        raise_on_status=False  # hand the last response back so raise_for_status reports it
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def get_session():
+    """Return the process-wide session, creating it on first use."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = build_session()
+    return _session
+
+
+def configure(pool_size=POOL_SIZE, retries=RETRIES, backoff_factor=BACKOFF_FACTOR):
+    """Replace the process-wide session with one using the given settings."""
+    global _session
+    with _session_lock:
+        old_session, _session = _session, build_session(pool_size, retries, backoff_factor)
+    if old_session is not None:
+        old_session.close()
+
+
+def get(url, params=None, headers=None, timeout=TIMEOUT):
+    """GET through the shared session so connections are reused across calls."""
+    return get_session().get(url, params=params, headers=headers, timeout=timeout)
+
+
+def get_with_limiter(url, limiter, params=None, headers=None, timeout=TIMEOUT, retries=RETRIES,
+                     backoff_factor=BACKOFF_FACTOR):
+    """
+    GET through the shared session, taking a rate-limiter token for every attempt
+
+    Args:
+        url (str): Request URL
+        limiter (AdaptiveRateLimiter): Limiter paced against and fed each attempt's status
+        params (dict): Query parameters
+        headers (dict): Request headers
+        timeout (float): Seconds per attempt
+        retries (int): Retries on 429 and 5xx responses
+        backoff_factor (float): Exponential backoff base in seconds
+
+    Returns:
+        requests.Response: The last response
+    """
+    for attempt in range(retries + 1):
+        limiter.acquire(url)
+        response = get(url, params=params, headers=headers, timeout=timeout)
+        delay = retry_after_seconds(response.headers)
+        limiter.record(url, attempt_statuses(response), delay)
+        if response.status_code not in RETRY_STATUSES or attempt == retries:
+            return response
+        # A throttled response with Retry-After already holds the host in the limiter,
+        # so the next acquire does the waiting; sleeping here as well would wait twice
+        if delay is None or response.status_code not in THROTTLE_STATUSES:
+            time.sleep(delay if delay is not None else backoff_factor * (2 ** attempt))
+
+
+def attempt_statuses(response):
+    """
+    Return the status code of every attempt behind a response, oldest first.
+    Connection retries happen inside urllib3, so their outcomes are only visible
+    in the retry history attached to the raw response.
+    """
+    retries = getattr(response.raw, "retries", None)
+    history = [entry.status for entry in getattr(retries, "history", ()) if entry.status is not None]
+    return history + [response.status_code]
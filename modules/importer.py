@@ -1,8 +1,25 @@
 import pandas as pd
+import pyarrow.compute as pc
 import streamlit as st
 import numpy as np
 import datetime
 import time
+import hashlib
+from collections import defaultdict
+from urllib.request import urlopen
+
+from modules.snapshot import Snapshot
+from modules.skill_index import SkillIndex
+from modules.cube import AggregateCube
+
+DATA_URL = 'https://storage.googleapis.com/gsearch_share/gsearch_jobs.csv'
+CACHE_TTL = 60*60*24 # ttl of one day to keep memory in cache longer
+CHUNK_SIZE = 50000 # rows per chunk when streaming the full dataset
+# Streamed chunks are read with fixed types so every chunk matches the snapshot schema:
+# the parsed salary columns are numeric, everything else (including the raw "101K-143K a year"
+# salary text) is read as text
+NUMERIC_COLUMNS = ['salary_avg', 'salary_min', 'salary_max', 'salary_hourly',
+                   'salary_yearly', 'salary_standardized']
 
 class DataImport:
     """" 
@@ -12,46 +29,231 @@ class DataImport:
         pass
 
     @staticmethod
-    @st.cache_data(ttl=60*60*24) # ttl of one day to keep memory in cache longer
-    def fetch_and_clean_data(max_rows=1000):  # Limit rows to process
+    @st.cache_data(ttl=CACHE_TTL)
+    def fetch_and_clean_data(max_rows=1000, use_snapshot=True):  # Limit rows to process, None loads everything
+        """
+        Load the cleaned job postings
+
+        Args:
+            max_rows (int): Rows to read from the CSV; None streams the full dataset
+            use_snapshot (bool): Reuse (and write) the on-disk snapshot
+
+        Returns:
+            pd.DataFrame: Cleaned rows, or with max_rows=None the Snapshot holding them;
+                the full dataset does not fit in one frame, so callers memory-map it
+                with Snapshot.load_table() and read only the columns they need
+        """
+        # Reuse the cleaned on-disk snapshot if a previous process already built it
+        snapshot = Snapshot(DataImport.snapshot_name(max_rows), ttl=CACHE_TTL)
+        if max_rows is None:
+            if use_snapshot and snapshot.is_fresh():
+                return snapshot
+            try:
+                return DataImport.stream_and_clean_data(snapshot=snapshot)
+            except Exception as e:
+                st.warning(f"Error streaming data from URL: {e}. Using dummy data instead.")
+                dummy = Snapshot("gsearch_jobs_dummy")
+                dummy.save(DataImport.create_dummy_data())
+                return dummy
+
+        if use_snapshot and snapshot.is_fresh():
+            try:
+                return snapshot.load()
+            except Exception as e:
+                st.warning(f"Error loading data snapshot: {e}. Reloading from source.")
+
         try:
             # Try to load real data
-            data_url = 'https://storage.googleapis.com/gsearch_share/gsearch_jobs.csv'
             # Using nrows parameter to limit data loading
-            jobs_data = pd.read_csv(data_url, nrows=max_rows).replace("'","", regex=True)
-            jobs_data.date_time = pd.to_datetime(jobs_data.date_time)
-            jobs_data = jobs_data.drop(labels=['Unnamed: 0', 'index'], axis=1, errors='ignore')
-            
-            # Only process necessary columns
-            if 'description_tokens' in jobs_data.columns:
-                jobs_data.description_tokens = jobs_data.description_tokens.str.strip("[]").str.split(",") # fix major formatting issues with tokens
-                jobs_data.description_tokens = jobs_data.description_tokens.apply(lambda row: [x.strip(" ") for x in row]) # remove whitespace from tokens
-            
-            # Ensure salary columns exist
-            if 'salary' not in jobs_data.columns:
-                jobs_data['salary'] = np.random.normal(80000, 20000, size=len(jobs_data))
-            if 'salary_min' not in jobs_data.columns:
-                jobs_data['salary_min'] = jobs_data['salary'] * 0.8
-            if 'salary_max' not in jobs_data.columns:
-                jobs_data['salary_max'] = jobs_data['salary'] * 1.2
-                
-            # Ensure country information exists
-            if 'country' not in jobs_data.columns:
-                countries = ['United States', 'United Kingdom', 'Canada', 'Australia', 'Germany', 
-                           'France', 'India', 'Singapore', 'Netherlands', 'Switzerland']
-                jobs_data['country'] = np.random.choice(countries, size=len(jobs_data))
-                
-            # Ensure experience level exists
-            if 'experience_level' not in jobs_data.columns:
-                exp_levels = ['Entry Level', 'Mid Level', 'Senior Level', 'Executive']
-                jobs_data['experience_level'] = np.random.choice(exp_levels, size=len(jobs_data))
-                
-            return jobs_data
+            jobs_data = DataImport.clean_data(pd.read_csv(DATA_URL, nrows=max_rows))
         except Exception as e:
             st.warning(f"Error loading data from URL: {e}. Using dummy data instead.")
             # Generate fake data for demonstration
             return DataImport.create_dummy_data()
+
+        if use_snapshot:
+            try:
+                snapshot.save(jobs_data)
+            except Exception as e:
+                st.warning(f"Error saving data snapshot: {e}")
+        return jobs_data
+
+    @staticmethod
+    def snapshot_name(max_rows):
+        return "gsearch_jobs_full" if max_rows is None else f"gsearch_jobs_{max_rows}"
+
+    @staticmethod
+    def stream_and_clean_data(chunksize=CHUNK_SIZE, snapshot=None):
+        """
+        Stream the full CSV in bounded chunks, cleaning each chunk independently
+        and appending it to an on-disk snapshot so peak memory stays flat
+
+        Args:
+            chunksize (int): Number of rows read and cleaned at a time
+            snapshot (Snapshot): Snapshot to write to (defaults to the full-dataset snapshot)
+
+        Returns:
+            Snapshot: The written snapshot, ready to be memory-mapped
+        """
+        if snapshot is None:
+            snapshot = Snapshot(DataImport.snapshot_name(None), ttl=CACHE_TTL)
+
+        # pandas buffers whole HTTP responses, so hand it a streaming file object instead
+        source = DATA_URL
+        response = None
+        if DATA_URL.startswith(("http://", "https://")):
+            response = source = urlopen(DATA_URL)
+        # Inferring types per chunk would let a column that is numeric early on hit text later
+        dtypes = defaultdict(lambda: str, {column: float for column in NUMERIC_COLUMNS})
+        try:
+            with snapshot.writer() as writer:
+                for chunk in pd.read_csv(source, chunksize=chunksize, dtype=dtypes):
+                    writer.write(DataImport.clean_data(chunk))
+        finally:
+            if response is not None:
+                response.close()
+        return snapshot
+
+    @staticmethod
+    def clean_data(jobs_data):
+        """
+        Clean a raw frame read from gsearch_jobs.csv
+
+        Args:
+            jobs_data (pd.DataFrame): Raw rows from the CSV
+
+        Returns:
+            pd.DataFrame: Cleaned rows with parsed description_tokens
+        """
+        jobs_data = jobs_data.replace("'","", regex=True)
+        jobs_data.date_time = pd.to_datetime(jobs_data.date_time)
+        jobs_data = jobs_data.drop(labels=['Unnamed: 0', 'index'], axis=1, errors='ignore')
+        
+        # Only process necessary columns
+        if 'description_tokens' in jobs_data.columns:
+            tokens = jobs_data.description_tokens.str.strip("[]") # fix major formatting issues with tokens
+            tokens = tokens.str.replace(r"\s*,\s*", ",", regex=True).str.strip(" ") # remove whitespace from tokens
+            jobs_data.description_tokens = tokens.str.split(",")
+        
+        # Ensure salary columns exist
+        if 'salary' not in jobs_data.columns:
+            jobs_data['salary'] = np.random.normal(80000, 20000, size=len(jobs_data))
+        if 'salary_min' not in jobs_data.columns:
+            jobs_data['salary_min'] = jobs_data['salary'] * 0.8
+        if 'salary_max' not in jobs_data.columns:
+            jobs_data['salary_max'] = jobs_data['salary'] * 1.2
+            
+        # Ensure country information exists
+        if 'country' not in jobs_data.columns:
+            countries = ['United States', 'United Kingdom', 'Canada', 'Australia', 'Germany', 
+                       'France', 'India', 'Singapore', 'Netherlands', 'Switzerland']
+            jobs_data['country'] = np.random.choice(countries, size=len(jobs_data))
+            
+        # Ensure experience level exists
+        if 'experience_level' not in jobs_data.columns:
+            exp_levels = ['Entry Level', 'Mid Level', 'Senior Level', 'Executive']
+            jobs_data['experience_level'] = np.random.choice(exp_levels, size=len(jobs_data))
+            
+        return jobs_data
     
+    @staticmethod
+    def build_skill_table(jobs_data, column='description_tokens'):
+        """
+        Explode description tokens into one long (job_id, skill) table
+
+        Args:
+            jobs_data (pd.DataFrame): Job postings with a tokens column
+            column (str): Column holding token lists, Arrow list arrays (from a snapshot) or "[a, b]" strings
+
+        Returns:
+            pd.DataFrame: One row per distinct skill per posting, where job_id is
+                the posting's index label in jobs_data
+        """
+        if jobs_data is None or column not in jobs_data.columns:
+            return pd.DataFrame({'job_id': pd.Series(dtype=object), 'skill': pd.Series(dtype=object)})
+
+        if isinstance(jobs_data[column].dtype, pd.ArrowDtype):
+            return DataImport._arrow_skill_table(jobs_data[column])
+
+        tokens = jobs_data[column].dropna()
+        # Raw strings are parsed with vectorized string ops; already parsed lists pass through untouched
+        text = tokens.str.strip("[]").dropna()
+        if not text.empty:
+            parsed = text.str.replace("'", "").str.split(",")
+            tokens = pd.concat([tokens.drop(index=text.index), parsed])
+
+        skills = tokens.explode().str.strip()
+        skills = skills[skills.notna() & (skills != "")]
+        skill_table = pd.DataFrame({'job_id': skills.index, 'skill': skills.to_numpy()})
+        return skill_table.drop_duplicates(ignore_index=True)
+
+    @staticmethod
+    def _arrow_skill_table(tokens):
+        # Snapshot list columns are flattened in Arrow, never materialising a Python list per posting
+        lists = tokens.array.__arrow_array__().combine_chunks()
+        skills = pc.utf8_trim_whitespace(pc.list_flatten(lists))
+        job_ids = tokens.index.take(pc.list_parent_indices(lists).to_numpy())
+        keep = pc.fill_null(pc.not_equal(skills, ""), False).to_numpy(zero_copy_only=False)
+        skill_table = pd.DataFrame({'job_id': job_ids[keep], 'skill': skills.to_numpy(zero_copy_only=False)[keep]})
+        return skill_table.drop_duplicates(ignore_index=True)
+
+    @staticmethod
+    def skill_table(jobs_data):
+        """
+        Return the (job_id, skill) table for jobs_data, building it once per session.
+        Pages should pass the unfiltered frame and filter the result by job_id.
+        """
+        return DataImport._session_cached('skill_table', jobs_data, DataImport.build_skill_table)
+
+    @staticmethod
+    def skill_index(jobs_data):
+        """
+        Return the skill -> postings inverted index for jobs_data, building it once per session.
+        Use SkillIndex.restrict to narrow it to a filtered frame.
+        """
+        return DataImport._session_cached(
+            'skill_index', jobs_data,
+            lambda data: SkillIndex.from_skill_table(DataImport.skill_table(data), data.index)
+        )
+
+    @staticmethod
+    def aggregate_cube(jobs_data):
+        """
+        Return the country x skill x period x experience_level x via cube for jobs_data,
+        building it once per session. Widgets should slice the cube rather than filter rows.
+        """
+        return DataImport._session_cached(
+            'aggregate_cube', jobs_data,
+            lambda data: AggregateCube.from_jobs(data, DataImport.skill_table(data))
+        )
+
+    @staticmethod
+    def dataset_version(jobs_data):
+        """
+        Return a short content hash of the columns the charts aggregate, computed once per session.
+        Process-wide caches key on it so sessions with the same data share entries.
+        """
+        return DataImport._session_cached('dataset_version', jobs_data, DataImport._content_hash)
+
+    @staticmethod
+    def _content_hash(jobs_data):
+        columns = [col for col in ['country', 'title'] if col in jobs_data.columns]
+        digest = hashlib.sha1()
+        digest.update(pd.util.hash_pandas_object(jobs_data[columns], index=True).to_numpy().tobytes())
+        digest.update(pd.util.hash_pandas_object(DataImport.skill_table(jobs_data), index=False).to_numpy().tobytes())
+        return digest.hexdigest()[:16]
+
+    @staticmethod
+    def _session_cached(key, jobs_data, build):
+        # Derived tables are rebuilt only when the session's jobs frame is replaced
+        cached = st.session_state.get(key)
+        if cached is not None and st.session_state.get(f'{key}_source') is jobs_data:
+            return cached
+        result = build(jobs_data)
+        st.session_state[key] = result
+        st.session_state[f'{key}_source'] = jobs_data
+        return result
+
     @staticmethod
     def create_dummy_data():
         # Create a DataFrame with dummy data for testing
@@ -0,0 +1,62 @@
+import sys
+import time
+import types
+import threading
+import importlib
+
+# Module name -> seconds spent importing it through a LazyModule, in load order
+IMPORT_TIMES = {}
+
+
+class LazyModule(types.ModuleType):
+    """
+    Stand-in for a heavy module that imports it on first attribute access.
+    Pages bind heavy libraries through lazy_import at the top of the script, so the
+    library is only loaded (and configured) when the feature using it first runs.
+    """
+    def __init__(self, name, on_import=None):
+        super().__init__(name)
+        self.__dict__["_lazy_on_import"] = on_import
+        self.__dict__["_lazy_module"] = None
+        self.__dict__["_lazy_lock"] = threading.Lock()
+
+    def _load(self):
+        module = self.__dict__["_lazy_module"]
+        if module is not None:
+            return module
+        with self.__dict__["_lazy_lock"]:
+            module = self.__dict__["_lazy_module"]
+            if module is None:
+                name = self.__name__
+                start = time.perf_counter()
+                module = importlib.import_module(name)
+                on_import = self.__dict__["_lazy_on_import"]
+                if on_import is not None:
+                    on_import(module)
+                IMPORT_TIMES[name] = time.perf_counter() - start
+                self.__dict__["_lazy_module"] = module
+        return module
+
+    def __getattr__(self, attribute):
+        return getattr(self._load(), attribute)
+
+    def __dir__(self):
+        return dir(self._load())
+
+
+def lazy_import(name, on_import=None):
+    """
+    Return a module proxy that imports name when one of its attributes is first used
+
+    Args:
+        name (str): Dotted module name, e.g. "plotly.express"
+        on_import (callable): Called once with the real module right after it is imported,
+            e.g. to configure an API client
+
+    Returns:
+        LazyModule: Proxy, or the module itself if something already imported it and
+            no on_import hook has to run
+    """
+    if on_import is None and name in sys.modules:
+        return sys.modules[name]
+    return LazyModule(name, on_import)
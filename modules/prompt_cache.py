@@ -0,0 +1,151 @@
+import os
+import json
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+import streamlit as st
+
+# Defaults can be tuned per deployment through environment variables
+CACHE_TTL = float(os.getenv("GEMINI_CACHE_TTL", 24*60*60))  # seconds an answer is reused; 0 disables the cache
+CACHE_SIZE = int(os.getenv("GEMINI_CACHE_SIZE", 256))  # answers kept, least recently used evicted first
+CACHE_PATH = os.getenv("GEMINI_CACHE_PATH", os.path.join("data", "cache", "gemini_responses.json"))  # "" keeps it in memory
+
+
+class PromptCache(object):
+    """
+    LRU cache of model responses keyed by (model, prompt), with a time-to-live.
+    Identical prompts (suggested questions, the same skill list) are answered from
+    memory; when a path is set the table is also written to disk so a restarted
+    server keeps its answers. Only successful, non-empty responses are stored.
+    """
+    def __init__(self, ttl=CACHE_TTL, maxsize=CACHE_SIZE, path=CACHE_PATH):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.path = path or None
+        self._entries = OrderedDict()  # key -> (response text, time stored)
+        self._lock = threading.Lock()
+        self._read()
+
+    @staticmethod
+    def key(model, prompt):
+        """Return the hex digest identifying a prompt sent to a model."""
+        request = json.dumps({"model": model, "prompt": prompt}, sort_keys=True)
+        return hashlib.sha256(request.encode("utf-8")).hexdigest()
+
+    def get(self, model, prompt):
+        """
+        Return the cached response for a prompt
+
+        Args:
+            model (str): Model name
+            prompt (str): Full prompt text
+
+        Returns:
+            str: Response text, or None if missing or expired
+        """
+        if not self.ttl:
+            return None
+        key = PromptCache.key(model, prompt)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.time() - entry[1] >= self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, model, prompt, text):
+        """Store a response, evicting the least recently used ones beyond maxsize."""
+        if not self.ttl or not text:
+            return
+        with self._lock:
+            key = PromptCache.key(model, prompt)
+            self._entries[key] = (text, time.time())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+            self._write()
+
+    def get_or_generate(self, model, prompt, generate):
+        """
+        Return the cached response, calling the model only on a miss
+
+        Args:
+            model (str): Model name
+            prompt (str): Full prompt text
+            generate (callable): Returns the response text; exceptions propagate and nothing is cached
+
+        Returns:
+            str: Response text
+        """
+        text = self.get(model, prompt)
+        if text is None:
+            text = generate()
+            self.put(model, prompt, text)
+        return text
+
+    def stream(self, model, prompt, open_stream):
+        """
+        Yield the response as chunks, from the cache when possible
+
+        Args:
+            model (str): Model name
+            prompt (str): Full prompt text
+            open_stream (callable): Starts the request and returns an iterator of text chunks
+
+        Yields:
+            str: The cached response in one piece, or the model's chunks as they arrive;
+                the joined text is stored only if the stream runs to completion
+        """
+        text = self.get(model, prompt)
+        if text is not None:
+            yield text
+            return
+        chunks = []
+        for chunk in open_stream():
+            chunks.append(chunk)
+            yield chunk
+        self.put(model, prompt, "".join(chunks))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._write()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _read(self):
+        if not self.path:
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                stored = json.load(f)
+        except (OSError, ValueError):
+            return
+        now = time.time()
+        for key, (text, stored_at) in stored.items():
+            if now - stored_at < self.ttl:
+                self._entries[key] = (text, stored_at)
+
+    def _write(self):
+        # Called with the lock held; written to a temp file and renamed so readers never see a partial table
+        if not self.path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"Error saving response cache: {str(e)}")
+
+
+@st.cache_resource
+def shared_prompt_cache():
+    """Return the process-wide PromptCache shared by every session."""
+    return PromptCache()
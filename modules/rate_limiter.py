@@ -0,0 +1,133 @@
+import os
+import time
+import asyncio
+import threading
+from urllib.parse import urlparse
+
+# Defaults can be tuned per deployment through environment variables
+INITIAL_RATE = float(os.getenv("RATE_LIMIT_INITIAL", 0.5))  # requests per second per host
+MIN_RATE = float(os.getenv("RATE_LIMIT_MIN", 0.05))
+MAX_RATE = float(os.getenv("RATE_LIMIT_MAX", 4.0))
+BURST = float(os.getenv("RATE_LIMIT_BURST", 1))
+INCREASE = 0.05  # added to the rate after every successful response
+DECREASE = 0.5  # rate multiplier after a throttled response
+THROTTLE_STATUSES = (429, 503)
+
+
+class TokenBucket(object):
+    """
+    Token bucket for a single host. Tokens refill at `rate` per second up to `burst`;
+    a request takes one token and waits for it if the bucket is empty.
+    """
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+
+    def reserve(self, now):
+        """Take a token and return how long the caller must wait before using it."""
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        # Tokens may go negative: each waiting caller holds a reservation further in the future
+        self.tokens -= 1
+        wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        return max(wait, self.blocked_until - now)
+
+
+class AdaptiveRateLimiter(object):
+    """
+    Per-host token buckets whose rate adapts to how the server responds.
+    Every success raises the rate additively up to max_rate; a 429/503 cuts it
+    multiplicatively and honours Retry-After, so throughput settles near the highest
+    rate the host accepts. The limiter is thread-safe and can be shared by blocking
+    (acquire) and asyncio (acquire_async) callers.
+    """
+    def __init__(self, rate=INITIAL_RATE, min_rate=MIN_RATE, max_rate=MAX_RATE, burst=BURST,
+                 increase=INCREASE, decrease=DECREASE):
+        self.initial_rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.burst = burst
+        self.increase = increase
+        self.decrease = decrease
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def host(url):
+        return urlparse(url).netloc or url
+
+    def rate(self, url):
+        """Return the current request rate (per second) for the host of url."""
+        with self._lock:
+            return self._bucket(url).rate
+
+    def reserve(self, url):
+        """Take a token for the host of url and return the seconds to wait before sending."""
+        with self._lock:
+            return self._bucket(url).reserve(time.monotonic())
+
+    def acquire(self, url):
+        """Block until a request to the host of url may be sent."""
+        wait = self.reserve(url)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, url):
+        """Wait without blocking the event loop until a request to the host of url may be sent."""
+        wait = self.reserve(url)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def on_success(self, url):
+        """Additive increase after a response that was not throttled."""
+        with self._lock:
+            bucket = self._bucket(url)
+            bucket.rate = min(self.max_rate, bucket.rate + self.increase)
+
+    def on_throttle(self, url, retry_after=None):
+        """
+        Multiplicative decrease after a throttled response
+
+        Args:
+            url (str): Request URL
+            retry_after (float): Seconds from the Retry-After header, if any
+        """
+        with self._lock:
+            bucket = self._bucket(url)
+            bucket.rate = max(self.min_rate, bucket.rate * self.decrease)
+            # Drop any saved-up burst so the next request waits a full interval
+            bucket.tokens = min(bucket.tokens, 0.0)
+            if retry_after:
+                bucket.blocked_until = max(bucket.blocked_until, time.monotonic() + retry_after)
+
+    def record(self, url, statuses, retry_after=None):
+        """
+        Feed the outcome of a request back into the limiter
+
+        Args:
+            url (str): Request URL
+            statuses (list): Status codes of every attempt, including transparent retries
+            retry_after (float): Seconds from the Retry-After header, if any
+        """
+        statuses = list(statuses)
+        if any(status in THROTTLE_STATUSES for status in statuses):
+            self.on_throttle(url, retry_after)
+        elif statuses and statuses[-1] < 500:
+            self.on_success(url)
+
+    def _bucket(self, url):
+        host = AdaptiveRateLimiter.host(url)
+        if host not in self._buckets:
+            self._buckets[host] = TokenBucket(self.initial_rate, self.burst)
+        return self._buckets[host]
+
+
+def retry_after_seconds(headers):
+    """Return the Retry-After header as seconds, or None if absent or not a number."""
+    try:
+        return max(0.0, float(headers.get("Retry-After")))
+    except (TypeError, ValueError):
+        return None
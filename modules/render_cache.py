@@ -0,0 +1,72 @@
+import io
+import threading
+from collections import OrderedDict
+import streamlit as st
+
+RENDER_CACHE_SIZE = 64  # rendered images kept per process
+
+
+class RenderCache(object):
+    """
+    LRU cache of rendered chart images (PNG bytes) keyed by everything the chart depends on.
+    A hit skips aggregation and plotting entirely; on a miss the figure is rendered once,
+    encoded, and closed so matplotlib does not keep it alive.
+    """
+    def __init__(self, maxsize=RENDER_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._images = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            image = self._images.get(key)
+            if image is not None:
+                self._images.move_to_end(key)
+            return image
+
+    def put(self, key, image):
+        with self._lock:
+            self._images[key] = image
+            self._images.move_to_end(key)
+            while len(self._images) > self.maxsize:
+                self._images.popitem(last=False)
+
+    def get_or_render(self, key, render):
+        """
+        Return the cached image for key, rendering it on a miss
+
+        Args:
+            key (tuple): Hashable description of the chart inputs
+            render (callable): Returns a matplotlib Figure; only called on a miss
+
+        Returns:
+            bytes: PNG image
+        """
+        image = self.get(key)
+        if image is None:
+            image = RenderCache.to_png(render())
+            self.put(key, image)
+        return image
+
+    @staticmethod
+    def to_png(fig):
+        import matplotlib.pyplot as plt
+        buffer = io.BytesIO()
+        try:
+            fig.savefig(buffer, format="png", bbox_inches="tight")
+        finally:
+            plt.close(fig)
+        return buffer.getvalue()
+
+    def clear(self):
+        with self._lock:
+            self._images.clear()
+
+    def __len__(self):
+        return len(self._images)
+
+
+@st.cache_resource
+def shared_render_cache():
+    """Return the process-wide RenderCache shared by every session."""
+    return RenderCache()
@@ -0,0 +1,147 @@
+import numpy as np
+import pandas as pd
+
+# Number of set bits for every byte value, used to count packed bitmaps
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+class SkillIndex(object):
+    """
+    Inverted index from each skill to the postings that mention it.
+    Postings are kept as sorted arrays of row positions into job_ids; packed
+    bitmaps are built lazily for AND/OR filters and co-occurrence counts.
+    """
+    def __init__(self, postings, job_ids):
+        self.postings = postings  # skill -> sorted np.ndarray of row positions
+        self.job_ids = pd.Index(job_ids)
+        self._bitmaps = {}
+
+    @classmethod
+    def from_skill_table(cls, skill_table, job_ids=None):
+        """
+        Build the index from a long (job_id, skill) table
+
+        Args:
+            skill_table (pd.DataFrame): Table from DataImport.build_skill_table
+            job_ids (list-like): Row order of the index, usually the jobs frame index
+
+        Returns:
+            SkillIndex: Index over the given rows
+        """
+        if job_ids is None:
+            job_ids = skill_table['job_id'].unique()
+        job_ids = pd.Index(job_ids)
+
+        positions = job_ids.get_indexer(skill_table['job_id'])
+        keep = positions >= 0
+        positions = positions[keep]
+        codes, skills = pd.factorize(skill_table['skill'].to_numpy()[keep])
+
+        # Sort by (skill, position) once, then cut the array at every skill boundary
+        order = np.lexsort((positions, codes))
+        positions = positions[order].astype(np.int32)
+        codes = codes[order]
+        bounds = np.flatnonzero(np.diff(codes)) + 1
+        postings = dict(zip(skills[codes[np.r_[0, bounds]]], np.split(positions, bounds))) if len(codes) else {}
+        return cls(postings, job_ids)
+
+    def __len__(self):
+        return len(self.job_ids)
+
+    def __contains__(self, skill):
+        return skill in self.postings
+
+    def skills(self):
+        return list(self.postings)
+
+    def positions(self, skill):
+        """Return the sorted row positions of postings mentioning skill."""
+        return self.postings.get(skill, np.empty(0, dtype=np.int32))
+
+    def ids(self, skill):
+        """Return the job ids of postings mentioning skill."""
+        return self.job_ids[self.positions(skill)]
+
+    def count(self, skill):
+        return len(self.positions(skill))
+
+    def counts(self):
+        """
+        Returns:
+            pd.Series: Number of postings per skill, most common first
+        """
+        counts = pd.Series({skill: len(rows) for skill, rows in self.postings.items()}, dtype=int)
+        return counts.sort_values(ascending=False, kind="stable")
+
+    def bitmap(self, skill):
+        """Return the packed bitmap (one bit per row) of postings mentioning skill."""
+        if skill not in self._bitmaps:
+            mask = np.zeros(len(self.job_ids), dtype=bool)
+            mask[self.positions(skill)] = True
+            self._bitmaps[skill] = np.packbits(mask)
+        return self._bitmaps[skill]
+
+    def all_of(self, skills):
+        """Return the row positions of postings mentioning every skill."""
+        skills = list(skills)
+        if not skills:
+            return np.arange(len(self.job_ids), dtype=np.int32)
+        # Start from the rarest skill so most rows drop out early
+        skills.sort(key=self.count)
+        bits = self.bitmap(skills[0]).copy()
+        for skill in skills[1:]:
+            np.bitwise_and(bits, self.bitmap(skill), out=bits)
+        return self._to_positions(bits)
+
+    def any_of(self, skills):
+        """Return the row positions of postings mentioning at least one skill."""
+        bits = np.zeros((len(self.job_ids) + 7) // 8, dtype=np.uint8)
+        for skill in skills:
+            np.bitwise_or(bits, self.bitmap(skill), out=bits)
+        return self._to_positions(bits)
+
+    def co_occurrence(self, skills):
+        """
+        Count postings shared by every pair of skills
+
+        Args:
+            skills (list): Skills to compare
+
+        Returns:
+            pd.DataFrame: Symmetric matrix whose diagonal holds the per-skill counts
+        """
+        skills = list(skills)
+        bitmaps = np.vstack([self.bitmap(skill) for skill in skills]) if skills else np.empty((0, 0), dtype=np.uint8)
+        counts = np.zeros((len(skills), len(skills)), dtype=np.int64)
+        for i in range(len(skills)):
+            shared = _POPCOUNT[np.bitwise_and(bitmaps[i], bitmaps[i:])].sum(axis=1, dtype=np.int64)
+            counts[i, i:] = shared
+            counts[i:, i] = shared
+        return pd.DataFrame(counts, index=skills, columns=skills)
+
+    def restrict(self, job_ids):
+        """
+        Return a new index over a subset of rows, in the order given
+
+        Args:
+            job_ids (list-like): Job ids to keep, e.g. the index of a filtered frame
+
+        Returns:
+            SkillIndex: Index whose positions line up with job_ids
+        """
+        job_ids = pd.Index(job_ids)
+        remap = np.full(len(self.job_ids), -1, dtype=np.int64)
+        old = self.job_ids.get_indexer(job_ids)
+        found = old >= 0
+        remap[old[found]] = np.flatnonzero(found)
+
+        postings = {}
+        for skill, rows in self.postings.items():
+            rows = remap[rows]
+            rows = np.sort(rows[rows >= 0]).astype(np.int32)
+            if len(rows):
+                postings[skill] = rows
+        return SkillIndex(postings, job_ids)
+
+    def _to_positions(self, bits):
+        return np.flatnonzero(np.unpackbits(bits, count=len(self.job_ids))).astype(np.int32)
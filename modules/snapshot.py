@@ -0,0 +1,166 @@
+import os
+import time
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+# Local directory used for on-disk snapshots of cleaned data
+CACHE_DIR = os.path.join("data", "cache")
+
+
+class Snapshot(object):
+    """
+    Persist a cleaned DataFrame as an Arrow IPC (Feather v2) file on local disk.
+    Files are written uncompressed so later loads can memory-map them directly
+    instead of re-downloading and re-cleaning the source CSV.
+    """
+    def __init__(self, name, ttl=None, cache_dir=CACHE_DIR):
+        self.name = name
+        self.ttl = ttl  # seconds; None keeps the snapshot until it is overwritten
+        self.path = os.path.join(cache_dir, f"{name}.arrow")
+
+    def exists(self):
+        return os.path.exists(self.path)
+
+    def is_fresh(self):
+        """Return True if the snapshot exists and is younger than its TTL."""
+        if not self.exists():
+            return False
+        if self.ttl is None:
+            return True
+        return (time.time() - os.path.getmtime(self.path)) < self.ttl
+
+    def version(self):
+        """Return a string identifying the current snapshot contents, or None."""
+        if not self.exists():
+            return None
+        stat = os.stat(self.path)
+        return f"{self.name}-{int(stat.st_mtime)}-{stat.st_size}"
+
+    def load_table(self):
+        """Memory-map the snapshot and return it as a pyarrow Table."""
+        return feather.read_table(self.path, memory_map=True)
+
+    def load(self):
+        """
+        Load the snapshot as a pandas DataFrame
+
+        Returns:
+            pd.DataFrame: DataFrame with list columns kept Arrow-backed (pd.ArrowDtype)
+        """
+        return Snapshot.table_to_frame(self.load_table())
+
+    def save(self, df):
+        """
+        Write the DataFrame to disk atomically (tmp file + rename)
+
+        Args:
+            df (pd.DataFrame): Cleaned DataFrame to persist
+        """
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        tmp_path = self.path + ".tmp"
+        feather.write_feather(table, tmp_path, compression="uncompressed")
+        os.replace(tmp_path, self.path)
+
+    def writer(self):
+        """Return a SnapshotWriter that appends frames to this snapshot incrementally."""
+        return SnapshotWriter(self.path)
+
+    def clear(self):
+        if self.exists():
+            os.remove(self.path)
+
+    @staticmethod
+    def table_to_frame(table):
+        # List columns stay Arrow-backed instead of becoming one Python object per row;
+        # DataImport.build_skill_table flattens them in Arrow
+        return table.to_pandas(types_mapper=Snapshot._arrow_lists)
+
+    @staticmethod
+    def _arrow_lists(data_type):
+        if pa.types.is_list(data_type) or pa.types.is_large_list(data_type):
+            return pd.ArrowDtype(data_type)
+        return None
+
+
+class SnapshotWriter(object):
+    """
+    Append DataFrames to an Arrow IPC file one batch at a time.
+    The schema is fixed by the first frame; later frames are conformed to it so
+    chunks with all-null or differently inferred columns can still be written.
+    The file is only moved into place when the writer is closed without error.
+    """
+    def __init__(self, path):
+        self.path = path
+        self.tmp_path = path + ".tmp"
+        self.schema = None
+        self.rows = 0
+        self._sink = None
+        self._writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close(commit=exc_type is None)
+        return False
+
+    def write(self, df):
+        """
+        Append one frame to the snapshot
+
+        Args:
+            df (pd.DataFrame): Cleaned chunk to append
+        """
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        if self._writer is None:
+            self.schema = SnapshotWriter._stable_schema(table)
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._sink = pa.OSFile(self.tmp_path, "wb")
+            self._writer = pa.ipc.new_file(self._sink, self.schema)
+        table = SnapshotWriter._conform(table, self.schema)
+        self._writer.write_table(table)
+        self.rows += table.num_rows
+
+    def close(self, commit=True):
+        if self._writer is not None:
+            self._writer.close()
+            self._sink.close()
+            self._writer = None
+        if commit and os.path.exists(self.tmp_path):
+            os.replace(self.tmp_path, self.path)
+        elif os.path.exists(self.tmp_path):
+            os.remove(self.tmp_path)
+
+    @staticmethod
+    def _stable_schema(table):
+        # Widen types that commonly change between chunks of the same CSV;
+        # an untyped column with no values yet could hold anything later, so keep it as text,
+        # while a typed one (e.g. a float column read with dtype= that is all NaN so far) keeps its type
+        fields = []
+        for field in table.schema:
+            if pa.types.is_null(field.type):
+                field = field.with_type(pa.string())
+            elif pa.types.is_integer(field.type):
+                field = field.with_type(pa.float64())
+            elif pa.types.is_list(field.type) and pa.types.is_null(field.type.value_type):
+                field = field.with_type(pa.list_(pa.string()))
+            fields.append(field)
+        return pa.schema(fields)
+
+    @staticmethod
+    def _conform(table, schema):
+        columns = []
+        for field in schema:
+            if field.name not in table.column_names:
+                columns.append(pa.nulls(table.num_rows, field.type))
+                continue
+            column = table.column(field.name)
+            if column.type != field.type:
+                if column.null_count == len(column):
+                    column = pa.nulls(table.num_rows, field.type)
+                else:
+                    column = column.cast(field.type)
+            columns.append(column)
+        return pa.Table.from_arrays(columns, schema=schema)
@@ -0,0 +1,39 @@
+import time
+
+
+class TimedStream(object):
+    """
+    Iterable over the text chunks of a streamed response that records its latency.
+    The request is started on iteration, so time_to_first_chunk covers the whole wait
+    before the first token is shown and total_seconds the full generation time.
+    Streams replayed from a cache are marked `cached` so their near-zero latencies
+    can be told apart from the model's.
+    """
+    def __init__(self, open_stream, cached=False):
+        self.open_stream = open_stream  # callable returning an iterator of text chunks
+        self.cached = cached
+        self.time_to_first_chunk = None
+        self.total_seconds = None
+        self.chunks = []
+
+    def __iter__(self):
+        start = time.perf_counter()
+        for chunk in self.open_stream():
+            if self.time_to_first_chunk is None:
+                self.time_to_first_chunk = time.perf_counter() - start
+            self.chunks.append(chunk)
+            yield chunk
+        self.total_seconds = time.perf_counter() - start
+
+    @property
+    def text(self):
+        return "".join(self.chunks)
+
+    def metrics(self):
+        """Return the recorded latencies in seconds (None until the stream has finished)."""
+        return {
+            "time_to_first_chunk": self.time_to_first_chunk,
+            "total_seconds": self.total_seconds,
+            "characters": len(self.text),
+            "cached": self.cached
+        }
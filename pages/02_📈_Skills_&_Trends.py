@@ -5,15 +5,11 @@ import pandas as pd
 import altair as alt
 import numpy as np
 import os
-import sys
-from collections import Counter
-import re
-from datetime import datetime, timedelta
-import requests
-from streamlit_lottie import st_lottie
 
 # Remove the utils import since we now rely on the static data via importer
 from modules import importer
+from modules import formater
+from modules.cube import UNKNOWN
 
 # Set page configuration
 st.set_page_config(
@@ -79,25 +75,36 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 #000 Side bar 0000-----------------------------------------------------------
-def load_lottie_url(url: str):
-    r = requests.get(url)
-    if r.status_code != 200:
-        return None
-    return r.json()
-
 # All sidebar content is defined within this block.
 with st.sidebar:
     # Navigation widget (assuming you want to keep your 5-page nav)
 
     st.markdown("### Trends on the Rise!")
     # This Lottie animation is related to upward growth; feel free to change the URL.
-    lottie_animation = load_lottie_url("https://lottie.host/97f8c6bb-f8a3-47ec-ada3-a60055ff9136/VR5hJGMtaW.json")
-    if lottie_animation:
-        st_lottie(lottie_animation, height=200, key="trending_anim")
-    else:
-        st.error("Animation could not be loaded.")
+    formater.Lottie.show("https://lottie.host/97f8c6bb-f8a3-47ec-ada3-a60055ff9136/VR5hJGMtaW.json", key="trending_anim")
 #000000---------------------------end------------------------0000
 
+def skill_category(skill):
+    """Map a skill name to its display category"""
+    category = "Unknown"
+    if any(tech in skill.lower() for tech in ["python", "r", "java", "c++", "javascript"]):
+        category = "Programming"
+    elif any(tech in skill.lower() for tech in ["sql", "database", "postgresql"]):
+        category = "Data"
+    elif any(tech in skill.lower() for tech in ["aws", "azure", "gcp", "cloud"]):
+        category = "Cloud"
+    elif any(tech in skill.lower() for tech in ["ml", "ai", "machine learning", "tensorflow", "pytorch"]):
+        category = "AI"
+    elif any(tech in skill.lower() for tech in ["react", "angular", "vue", "html", "css"]):
+        category = "Web Development"
+    elif any(tech in skill.lower() for tech in ["docker", "kubernetes", "devops", "ci/cd"]):
+        category = "DevOps"
+    elif any(tech in skill.lower() for tech in ["excel", "word", "powerpoint", "office"]):
+        category = "Office"
+    elif any(tech in skill.lower() for tech in ["tableau", "power bi", "looker", "visualization"]):
+        category = "Visualization"
+    return category
+
 def extract_skill_trends(jobs_data):
     """Extract skill trends data from the jobs dataframe"""
     if jobs_data is None or jobs_data.empty or 'description_tokens' not in jobs_data.columns:
@@ -105,61 +112,32 @@ def extract_skill_trends(jobs_data):
     
     try:
         if 'posted_at' in jobs_data.columns:
-            jobs_data['posted_date'] = pd.to_datetime(jobs_data['posted_at'], errors='coerce')
-            valid_dates = jobs_data.dropna(subset=['posted_date'])
-            if not valid_dates.empty:
-                min_date = valid_dates['posted_date'].min()
-                max_date = valid_dates['posted_date'].max()
-                total_days = (max_date - min_date).days
+            # Monthly cube cells are rolled up to quarters; postings are not rescanned
+            cube = importer.DataImport.aggregate_cube(jobs_data)
+            months = [period for period in cube.values('period') if period != UNKNOWN]
+            if months:
+                months = pd.PeriodIndex(months, freq='M')
+                total_days = (months.max().end_time - months.min().start_time).days
                 if total_days > 180:  # More than 6 months of data
-                    periods = []
-                    current_date = min_date
-                    while current_date <= max_date:
-                        next_date = current_date + timedelta(days=90)  # Approximately a quarter
-                        period_name = current_date.strftime("%Y-Q%q").replace("%q", str((current_date.month-1)//3+1))
-                        periods.append((period_name, current_date, next_date))
-                        current_date = next_date
+                    quarters = pd.period_range(months.min().asfreq('Q'), months.max().asfreq('Q'), freq='Q')
+                    periods = [f"{quarter.year}-Q{quarter.quarter}" for quarter in quarters]
+                    quarter_of = {str(month): f"{month.year}-Q{month.quarter}" for month in months}
                     
-                    skill_trends = []
-                    for period_name, start_date, end_date in periods:
-                        period_jobs = valid_dates[(valid_dates['posted_date'] >= start_date) & 
-                                                  (valid_dates['posted_date'] < end_date)]
-                        if not period_jobs.empty:
-                            period_skills = []
-                            for tokens in period_jobs['description_tokens'].dropna():
-                                if isinstance(tokens, str):
-                                    skills = tokens.strip("[]").replace("'", "").split(", ")
-                                    period_skills.extend([s for s in skills if s])
-                            skill_counts = Counter(period_skills)
-                            total_jobs = len(period_jobs)
-                            for skill, count in skill_counts.items():
-                                popularity = (count / total_jobs) * 100
-                                if popularity >= 1:
-                                    category = "Unknown"
-                                    if any(tech in skill.lower() for tech in ["python", "r", "java", "c++", "javascript"]):
-                                        category = "Programming"
-                                    elif any(tech in skill.lower() for tech in ["sql", "database", "postgresql"]):
-                                        category = "Data"
-                                    elif any(tech in skill.lower() for tech in ["aws", "azure", "gcp", "cloud"]):
-                                        category = "Cloud"
-                                    elif any(tech in skill.lower() for tech in ["ml", "ai", "machine learning", "tensorflow", "pytorch"]):
-                                        category = "AI"
-                                    elif any(tech in skill.lower() for tech in ["react", "angular", "vue", "html", "css"]):
-                                        category = "Web Development"
-                                    elif any(tech in skill.lower() for tech in ["docker", "kubernetes", "devops", "ci/cd"]):
-                                        category = "DevOps"
-                                    elif any(tech in skill.lower() for tech in ["excel", "word", "powerpoint", "office"]):
-                                        category = "Office"
-                                    elif any(tech in skill.lower() for tech in ["tableau", "power bi", "looker", "visualization"]):
-                                        category = "Visualization"
-                                    
-                                    skill_trends.append({
-                                        "Skill": skill,
-                                        "Category": category,
-                                        "Period": period_name,
-                                        "Popularity": popularity
-                                    })
-                    trend_df = pd.DataFrame(skill_trends)
+                    dated = cube.slice(period=list(quarter_of))
+                    skill_counts = dated.totals(['period', 'skill'])
+                    skill_counts['quarter'] = skill_counts['period'].map(quarter_of)
+                    skill_counts = skill_counts.groupby(['quarter', 'skill'])['postings'].sum().rename('count').reset_index()
+                    period_totals = dated.totals(['period'])
+                    total_jobs = period_totals.groupby(period_totals['period'].map(quarter_of))['postings'].sum()
+                    skill_counts['popularity'] = (skill_counts['count'] / skill_counts['quarter'].map(total_jobs)) * 100
+                    skill_counts = skill_counts[skill_counts['popularity'] >= 1]
+                    categories = {skill: skill_category(skill) for skill in skill_counts['skill'].unique()}
+                    trend_df = pd.DataFrame({
+                        "Skill": skill_counts['skill'],
+                        "Category": skill_counts['skill'].map(categories),
+                        "Period": skill_counts['quarter'],
+                        "Popularity": skill_counts['popularity']
+                    })
                     if not trend_df.empty:
                         pivot_df = trend_df.pivot_table(
                             index=["Skill", "Category"],
@@ -167,10 +145,10 @@ def extract_skill_trends(jobs_data):
                             values="Popularity",
                             aggfunc='mean'
                         ).reset_index()
-                        for period_name, _, _ in periods:
+                        for period_name in periods:
                             if period_name in pivot_df.columns:
                                 pivot_df[period_name] = pivot_df[period_name].fillna(0)
-                        all_periods = [p[0] for p in periods]
+                        all_periods = periods
                         for i in range(1, len(all_periods)):
                             current = all_periods[i]
                             previous = all_periods[i-1]
@@ -1,28 +1,29 @@
 import streamlit as st
 import pandas as pd
 import altair as alt
-import plotly.express as px
-import plotly.graph_objects as go
 import numpy as np
 import os
 from datetime import datetime
 from collections import Counter
 import re
 from dotenv import load_dotenv
-import google.generativeai as genai
-from streamlit_lottie import st_lottie
-import requests
 
 
+import serp_api  # Shared skill extraction
 from modules import importer  # Data import module
 from modules import formater  # Page formatting module
+from modules.lazy import lazy_import  # Heavy libraries load on first use
+from modules import prompt_cache  # Shared Gemini response cache
 
 # ---------- CONFIGURATION ----------
 load_dotenv()
 GENAI_API_KEY = os.getenv("GOOGLE_API_KEY")
 if not GENAI_API_KEY:
     st.error("Google API key not found in .env file.")
-genai.configure(api_key=GENAI_API_KEY)
+# Gemini is imported and configured only when an insight is first requested
+genai = lazy_import("google.generativeai", on_import=lambda module: module.configure(api_key=GENAI_API_KEY))
+px = lazy_import("plotly.express")
+go = lazy_import("plotly.graph_objects")
 
 title_obj = formater.Title()
 title_obj.page_config("N3DN.Tech - Home")
@@ -61,23 +62,13 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 #--------------SIDE BAR ANIMATION0---------------------------
-def load_lottie_url(url: str):
-    r = requests.get(url)
-    if r.status_code != 200:
-        return None
-    return r.json()
-
 with st.sidebar:
     # Navigation widget for your top pages
 
     # Animation section for a "top" or "reaching new heights" theme
     st.markdown("### Unlock Your Potential: Discover the Top Skills in Demand!")
     # Using a different Lottie animation URL (feel free to replace this URL with another if needed)
-    lottie_animation = load_lottie_url("https://lottie.host/24a9d74c-0102-4abb-b1ef-967e962d9bee/B9iFXML8x0.json")
-    if lottie_animation:
-        st_lottie(lottie_animation, height=200, key="top_anim")
-    else:
-        st.error("Animation could not be loaded.")
+    formater.Lottie.show("https://lottie.host/24a9d74c-0102-4abb-b1ef-967e962d9bee/B9iFXML8x0.json", key="top_anim")
 
 #-------------END HERE---------------------------------
 
@@ -91,47 +82,13 @@ def load_jobs_data():
         return data
 
 # ---------- SKILL EXTRACTION FUNCTIONS ----------
-def extract_skills(description):
-    tech_skills = {
-        "python", "java", "javascript", "typescript", "c++", "c#", "ruby", "php", "swift", "kotlin", "go", "rust",
-        "r", "matlab", "scala", "perl", "shell", "bash",
-        "html", "css", "react", "angular", "vue", "node.js", "express", "django", "flask", "spring", "asp.net",
-        "jquery", "bootstrap", "sass", "less", "webpack", "next.js", "nuxt.js",
-        "sql", "mysql", "postgresql", "mongodb", "redis", "elasticsearch", "cassandra", "oracle", "sqlite",
-        "dynamodb", "neo4j", "firebase", "bigquery", "snowflake",
-        "aws", "azure", "gcp", "docker", "kubernetes", "jenkins", "terraform", "ansible", "circleci", "git",
-        "prometheus", "grafana", "elk stack", "splunk", "new relic", "datadog",
-        "machine learning", "deep learning", "tensorflow", "pytorch", "scikit-learn", "pandas", "numpy",
-        "data analysis", "statistics", "spss", "tableau", "power bi", "looker", "d3.js", "matplotlib",
-        "seaborn", "jupyter", "hHeightsadoop", "spark", "kafka", "airflow", "dbt",
-        "react native", "flutter", "ios", "android", "xcode", "android studio",
-        "security", "penetration testing", "ethical hacking", "firewall", "vpn", "ssl", "encryption",
-        "agile", "scrum", "jira", "confluence", "trello", "asana", "project management",
-        "rest api", "graphql", "microservices", "ci/cd", "blockchain", "web3", "solidity",
-        "unity", "unreal engine", "game development", "ar", "vr", "iot", "edge computing",
-        "communication", "leadership", "problem solving", "teamwork", "office"
-    }
-    if not description:
-        return []
-    desc = description.lower()
-    found = []
-    for skill in tech_skills:
-        if skill in desc:
-            if skill == 'r' and not any(x in desc for x in ['ruby', 'rust', 'react']):
-                found.append(skill)
-            elif skill != 'r':
-                found.append(skill)
-    return sorted(found)
-
+# Skill matching is shared with serp_api so both use the same compiled pattern
 def extract_skills_data(jobs_data):
     if jobs_data is None or jobs_data.empty:
         return pd.DataFrame()
-    all_skills = []
-    for desc in jobs_data['description'].dropna():
-        if isinstance(desc, str):
-            skills = extract_skills(desc)
-            all_skills.extend(skills)
-    counts = Counter(all_skills)
+    # Descriptions are processed in one batch, split across worker processes for large frames
+    skill_lists = serp_api.extract_skills_batch(jobs_data['description'].dropna())
+    counts = skill_lists.explode().dropna().value_counts()
     total = len(jobs_data)
     data = []
     for skill, count in counts.items():
@@ -171,10 +128,12 @@ def get_gemini_insight(skills_list):
         "of the following skills: " + ", ".join(skills_list) + ". "
         "Break your response into clear sections with bullet points, using simple language."
     )
+    model_name = 'gemini-1.5-flash-latest'
     try:
-        model = genai.GenerativeModel('gemini-1.5-flash-latest')
-        response = model.generate_content([prompt])
-        return response.text
+        # The same skill selection is answered from the shared cache instead of calling the model again
+        return prompt_cache.shared_prompt_cache().get_or_generate(
+            model_name, prompt, lambda: genai.GenerativeModel(model_name).generate_content([prompt]).text
+        )
     except Exception as e:
         st.error(f"Error generating insight: {e}")
         return "Unable to generate insight at this time."
@@ -244,6 +203,40 @@ def main():
         fig.update_traces(textposition='inside', textinfo='percent+label')
         st.plotly_chart(fig, use_container_width=True)
     
+    # -------- Skill Combinations Section --------
+    st.markdown("### Skill Combinations")
+    # The session-wide inverted index is narrowed to the filtered postings instead of being rebuilt
+    skill_index = importer.DataImport.skill_index(st.session_state.jobs_data).restrict(jobs_data.index)
+    skill_counts = skill_index.counts()
+    if skill_counts.empty:
+        st.info("No description tokens available for skill combinations.")
+    else:
+        combo_skills = st.multiselect("Select Skills to Combine", options=skill_counts.index.tolist(),
+                                      default=skill_counts.index[:3].tolist())
+        if combo_skills:
+            match_mode = st.radio("Postings must mention", options=["All selected skills", "Any selected skill"],
+                                  horizontal=True)
+            if match_mode == "All selected skills":
+                matches = skill_index.all_of(combo_skills)
+            else:
+                matches = skill_index.any_of(combo_skills)
+            share = len(matches) / len(skill_index) * 100 if len(skill_index) else 0
+            st.markdown(f"**{len(matches):,}** of {len(skill_index):,} postings ({share:.1f}%) match.")
+
+            if len(combo_skills) > 1:
+                # Pairwise counts of postings that mention both skills; the diagonal is each skill on its own
+                pairs = skill_index.co_occurrence(combo_skills)
+                pairs = pairs.rename_axis("Skill").reset_index().melt(id_vars="Skill", var_name="With", value_name="Postings")
+                heatmap = alt.Chart(pairs).mark_rect().encode(
+                    x=alt.X("With:N", title=None, sort=combo_skills),
+                    y=alt.Y("Skill:N", title=None, sort=combo_skills),
+                    color=alt.Color("Postings:Q", scale=alt.Scale(scheme="greens")),
+                    tooltip=["Skill", "With", "Postings"]
+                ).properties(width=500, height=400)
+                st.altair_chart(heatmap, use_container_width=True)
+        else:
+            st.warning("Please select at least one skill to combine.")
+
     # -------- Advanced 3D Visualizations Section --------
     st.markdown("### Advanced 3D Visualizations")
     advanced_option = st.radio("Select 3D Visualization", options=["3D Word Cloud", "3D Surface/Heatmap"], horizontal=True)
@@ -9,12 +9,16 @@ import sys
 from collections import Counter
 import random
 import re
-from streamlit_lottie import st_lottie
-import requests
+from datetime import date
 
 
 # Use serp_api for real-time data fetching
 import serp_api
+from modules import importer
+from modules import formater
+from modules.cube import AggregateCube
+from modules.dataset_store import PartitionedDataset
+from modules import prompt_cache
 
 # Load environment variables and Google API key for Gemini
 from dotenv import load_dotenv
@@ -77,12 +81,6 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 #000--------------Sidebar------------------------
-def load_lottie_url(url: str):
-    r = requests.get(url)
-    if r.status_code != 200:
-        return None
-    return r.json()
-
 # All sidebar content is defined inside this block.
 with st.sidebar:
     # Navigation widget for your top pages
@@ -90,16 +88,12 @@ with st.sidebar:
     # Animation section: mountain-themed animation for "on top"
     st.markdown("### Explore Jobs & Salaries: Find the Right Opportunity for You!")
     # Replace the URL below with any mountain top or summit-themed Lottie animation.
-    lottie_animation = load_lottie_url("https://lottie.host/3152497e-ca08-4b25-87ed-7029d7b6c4f6/fmUfViickm.json")
-    if lottie_animation:
-        st_lottie(lottie_animation, height=200, key="mountain_anim")
-    else:
-        st.error("Animation could not be loaded.")
+    formater.Lottie.show("https://lottie.host/3152497e-ca08-4b25-87ed-7029d7b6c4f6/fmUfViickm.json", key="mountain_anim")
 #-------------------End here-----------------------------------------------
 
 #------------------ends here-------------------
 
-def extract_skills_vs_pay(jobs_data):
+def extract_skills_vs_pay(jobs_data, cube=None):
     """Extract skills vs pay data from the jobs dataframe"""
     if jobs_data is None or jobs_data.empty:
         return pd.DataFrame()
@@ -111,29 +105,24 @@ def extract_skills_vs_pay(jobs_data):
         return pd.DataFrame()
     
     try:
-        salary_col = 'salary_yearly' if 'salary_yearly' in jobs_data.columns else 'salary'
-        valid_jobs = jobs_data.dropna(subset=[salary_col, 'description_tokens'])
-        if valid_jobs.empty:
+        if cube is None:
+            cube = AggregateCube.from_jobs(jobs_data, importer.DataImport.build_skill_table(jobs_data))
+        # Per-skill salary statistics come straight from the pre-aggregated cube cells
+        overall = cube.totals()
+        if overall.empty or not overall['salary_count'].iloc[0]:
             return pd.DataFrame()
+        avg_overall_salary = overall['salary_mean'].iloc[0]
         
-        all_skills = []
-        for tokens in valid_jobs['description_tokens']:
-            if isinstance(tokens, str):
-                skills = tokens.strip("[]").replace("'", "").split(", ")
-                all_skills.extend([s for s in skills if s])
-        
-        skill_counts = Counter(all_skills)
-        top_skills = [skill for skill, count in skill_counts.most_common(200)]
+        skill_totals = cube.totals(['skill']).sort_values('salary_count', ascending=False, kind='stable').head(200)
+        medians = cube.slice(skill=skill_totals['skill']).quantile(0.5, ['skill'])
+        top_skills = skill_totals.set_index('skill')
         
         skills_data = []
-        for skill in top_skills:
-            skill_jobs = valid_jobs[valid_jobs['description_tokens'].apply(
-                lambda x: isinstance(x, str) and skill in x
-            )]
-            if len(skill_jobs) >= 10:
-                avg_salary = skill_jobs[salary_col].mean()
-                median_salary = skill_jobs[salary_col].median()
-                job_count = len(skill_jobs)
+        for skill, totals in top_skills.iterrows():
+            if totals['salary_count'] >= 10:
+                avg_salary = totals['salary_mean']
+                median_salary = medians.get(skill, np.nan)  # approximate, from the salary sketch
+                job_count = int(totals['salary_count'])
                 category = "Unknown"
                 if any(tech in skill.lower() for tech in ["python", "r", "java", "c++", "javascript"]):
                     category = "Programming"
@@ -152,7 +141,6 @@ def extract_skills_vs_pay(jobs_data):
                 elif any(tech in skill.lower() for tech in ["tableau", "power bi", "looker", "visualization"]):
                     category = "Visualization"
                 
-                avg_overall_salary = valid_jobs[salary_col].mean()
                 salary_premium_pct = ((avg_salary / avg_overall_salary) - 1) * 100
                 
                 skills_data.append({
@@ -232,22 +220,29 @@ def load_jobs_data():
     if 'jobs_data' in st.session_state and st.session_state.jobs_data is not None:
         return st.session_state.jobs_data
     
-    st.info("Fetching real-time job data. This may take a few minutes...")
     job_roles = ["Data Scientist", "Software Engineer", "Data Engineer"]
     locations = ["United States", "Remote"]
-    all_data = []
-    
-    for role in job_roles:
-        for location in locations:
-            try:
-                job_df = serp_api.get_job_data(query=role.lower(), location=location, limit=20)
-                if not job_df.empty:
-                    job_df["search_role"] = role
-                    job_df["search_location"] = location
-                    all_data.append(job_df)
-            except Exception as e:
-                st.error(f"Error fetching data for {role} in {location}: {str(e)}")
     
+    # Today's partitions of the build dataset are reused; only missing searches go to the network
+    store = PartitionedDataset()
+    all_data = [store.read(roles=job_roles, locations=locations, since=date.today())]
+    fetched = set(zip(all_data[0].get("search_role", []), all_data[0].get("search_location", [])))
+    missing = [(role, location) for role in job_roles for location in locations if (role, location) not in fetched]
+    
+    if missing:
+        st.info("Fetching real-time job data. This may take a few minutes...")
+    for role, location in missing:
+        try:
+            job_df = serp_api.get_job_data(query=role.lower(), location=location, limit=20)
+            if not job_df.empty:
+                job_df["search_role"] = role
+                job_df["search_location"] = location
+                store.replace(job_df, role, location)
+                all_data.append(job_df)
+        except Exception as e:
+            st.error(f"Error fetching data for {role} in {location}: {str(e)}")
+    
+    all_data = [df for df in all_data if not df.empty]
     if all_data:
         combined_df = pd.concat(all_data, ignore_index=True)
         st.session_state.jobs_data = combined_df
@@ -271,8 +266,9 @@ def generate_insight_recommendation(skill, salary):
     if gemini and GOOGLE_API_KEY:
         try:
             # The exact call may vary based on the Gemini library’s documentation.
-            response = gemini.generate_text(prompt, api_key=GOOGLE_API_KEY)
-            return response.text
+            return prompt_cache.shared_prompt_cache().get_or_generate(
+                "gemini.generate_text", prompt, lambda: gemini.generate_text(prompt, api_key=GOOGLE_API_KEY).text
+            )
         except Exception as e:
             return f"Error generating insight: {e}"
     else:
@@ -299,6 +295,7 @@ def main():
             unsafe_allow_html=True
         )
         return
+    cube = importer.DataImport.aggregate_cube(jobs_data)
     
     # -------- Filters Section --------
     st.markdown('<div class="filter-container">', unsafe_allow_html=True)
@@ -310,6 +307,7 @@ def main():
             countries = sorted(jobs_data["country"].dropna().unique().tolist())
             selected_countries = st.multiselect("Select Countries", options=countries, default=countries)
             jobs_data = jobs_data[jobs_data["country"].isin(selected_countries)]
+            cube = cube.slice(country=selected_countries)
         else:
             selected_countries = []
     
@@ -318,7 +316,7 @@ def main():
     
     col_filter3, col_filter4 = st.columns(2)
     with col_filter3:
-        df = extract_skills_vs_pay(jobs_data)
+        df = extract_skills_vs_pay(jobs_data, cube)
         if df.empty:
             df = create_synthetic_skills_vs_pay()
         categories = df["Category"].unique().tolist()
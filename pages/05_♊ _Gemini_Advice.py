@@ -1,13 +1,16 @@
 import streamlit as st
 import os
-import google.generativeai as genai
 from dotenv import load_dotenv
-import requests
-from streamlit_lottie import st_lottie
+
+from modules import formater
+from modules.lazy import lazy_import
+from modules import prompt_cache
+from modules import streaming
 
 # ---------- CONFIGURATIONS ----------
 load_dotenv()
-genai.configure(api_key=os.getenv("GOOGLE_API_KEY"))
+# Gemini is imported and configured only when the first question is asked
+genai = lazy_import("google.generativeai", on_import=lambda module: module.configure(api_key=os.getenv("GOOGLE_API_KEY")))
 
 # Custom CSS
 st.markdown("""
@@ -112,12 +115,6 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 #------------Side bar animation------------------------------------------------
-def load_lottie_url(url: str):
-    r = requests.get(url)
-    if r.status_code != 200:
-        return None
-    return r.json()
-
 # All sidebar content is defined inside this block.
 with st.sidebar:
     # Navigation widget for your top pages
@@ -125,23 +122,14 @@ with st.sidebar:
     # Animation section: mountain-themed animation for "on top"
     st.markdown("### Gemini Advisor: Your Smart Guide to Career Success!")
     # Replace the URL below with any mountain top or summit-themed Lottie animation.
-    lottie_animation = load_lottie_url("https://assets3.lottiefiles.com/packages/lf20_3vbOcw.json")
-    if lottie_animation:
-        st_lottie(lottie_animation, height=200, key="mountain_anim")
-    else:
-        st.error("Animation could not be loaded.")
+    formater.Lottie.show("https://assets3.lottiefiles.com/packages/lf20_3vbOcw.json", key="mountain_anim")
 #-------------------End here-----------------------------------------------
 
 
 import streamlit as st
 import os
-import google.generativeai as genai
 from dotenv import load_dotenv
 
-# ---------- CONFIGURATIONS ----------
-load_dotenv()
-genai.configure(api_key=os.getenv("GOOGLE_API_KEY"))
-
 # System prompt defining strict career-related guidelines
 system_prompt = (
     "You are an AI career advisor specializing in technology career guidance. Your name is Gemini Advisor.\n\n"
@@ -156,16 +144,43 @@ system_prompt = (
 )
 
 def get_gemini_response(user_question):
-    model = genai.GenerativeModel('gemini-1.5-flash-latest')
+    model_name = 'gemini-1.5-flash-latest'
     # Combine the system prompt with the user's question
     prompt = system_prompt + "\nUser Question: " + user_question
     try:
-        response = model.generate_content([prompt])
-        return response.text
+        # Repeated questions (e.g. the suggested ones) are answered from the shared cache
+        return prompt_cache.shared_prompt_cache().get_or_generate(
+            model_name, prompt, lambda: genai.GenerativeModel(model_name).generate_content([prompt]).text
+        )
     except Exception as e:
         st.error(f"🤖 AI Error: {e}")
         return None
 
+def stream_gemini_response(user_question):
+    """
+    Stream the answer to a question, recording time to first chunk and total latency
+
+    Args:
+        user_question (str): Question typed or picked by the user
+
+    Returns:
+        streaming.TimedStream: Chunks for st.write_stream; a repeated question is
+            served from the shared cache in one chunk and marked as cached
+    """
+    model_name = 'gemini-1.5-flash-latest'
+    prompt = system_prompt + "\nUser Question: " + user_question
+    cache = prompt_cache.shared_prompt_cache()
+
+    cached_text = cache.get(model_name, prompt)
+    if cached_text is not None:
+        return streaming.TimedStream(lambda: iter([cached_text]), cached=True)
+
+    def open_stream():
+        response = genai.GenerativeModel(model_name).generate_content([prompt], stream=True)
+        return (chunk.text for chunk in response)
+
+    return streaming.TimedStream(lambda: cache.stream(model_name, prompt, open_stream))
+
 def main():
     st.markdown('<p style="font-size: 3.0rem; font-weight: bold; color: #6eb52f;">Gemini Advisor - Career Q&A</p>', unsafe_allow_html=True)
 
@@ -195,9 +210,27 @@ def main():
             st.session_state.user_input = question
 
     user_question = st.text_input("Enter your question:", key="user_input")
+    stream_answers = st.checkbox("Show the answer as it is written", value=True)
     
     if st.button("Ask Question"):
-        if user_question:
+        if user_question and stream_answers:
+            st.subheader("Gemini Advisor Response:")
+            stream = stream_gemini_response(user_question)
+            try:
+                st.write_stream(stream)
+            except Exception as e:
+                st.error(f"🤖 AI Error: {e}")
+            else:
+                # Latencies of every answer the model streamed in this session, for comparing perceived
+                # and total wait; cache hits would drag both towards zero, so they are left out
+                metrics = stream.metrics()
+                if metrics["cached"]:
+                    st.caption("Answered from the response cache")
+                elif metrics["time_to_first_chunk"] is not None:
+                    st.session_state.setdefault("gemini_latency", []).append(metrics)
+                    st.caption(f"First words after {metrics['time_to_first_chunk']:.2f}s · "
+                               f"full answer in {metrics['total_seconds']:.2f}s")
+        elif user_question:
             with st.spinner("Engaging neural networks..."):
                 response = get_gemini_response(user_question)
             if response:
@@ -1,10 +1,107 @@
 import os
-import requests
-from bs4 import BeautifulSoup
+try:
+    from lxml import html as lxml_html
+except ImportError:
+    lxml_html = None
 import pandas as pd
+import numpy as np
 from datetime import datetime
-import time
-import random
+import re
+import atexit
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+from modules.fetch_engine import AsyncFetchEngine
+from modules.http_cache import ResponseCache
+from modules import http_client
+from modules.rate_limiter import AdaptiveRateLimiter
+from modules.checkpoint import BuildCheckpoint, BUILD_DIR
+from modules.dataset_store import PartitionedDataset, DATASET_DIR
+from modules.lazy import lazy_import
+
+# Only the html.parser fallback and news search use BeautifulSoup
+bs4 = lazy_import("bs4")
+
+TECH_SKILLS = frozenset({
+    "python", "java", "javascript", "typescript", "c++", "c#", "ruby", "php", "swift", "kotlin", "go", "rust",
+    "r", "matlab", "scala", "perl", "shell", "bash",
+    "html", "css", "react", "angular", "vue", "node.js", "express", "django", "flask", "spring", "asp.net",
+    "jquery", "bootstrap", "sass", "less", "webpack", "next.js", "nuxt.js",
+    "sql", "mysql", "postgresql", "mongodb", "redis", "elasticsearch", "cassandra", "oracle", "sqlite",
+    "dynamodb", "neo4j", "firebase", "bigquery", "snowflake",
+    "aws", "azure", "gcp", "docker", "kubernetes", "jenkins", "terraform", "ansible", "circleci", "git",
+    "prometheus", "grafana", "elk stack", "splunk", "new relic", "datadog",
+    "machine learning", "deep learning", "tensorflow", "pytorch", "scikit-learn", "pandas", "numpy",
+    "data analysis", "statistics", "spss", "tableau", "power bi", "looker", "d3.js", "matplotlib",
+    "seaborn", "jupyter", "hadoop", "spark", "kafka", "airflow", "dbt",
+    "react native", "flutter", "ios", "android", "xcode", "android studio",
+    "security", "penetration testing", "ethical hacking", "firewall", "vpn", "ssl", "encryption",
+    "agile", "scrum", "jira", "confluence", "trello", "asana", "project management",
+    "rest api", "graphql", "microservices", "ci/cd", "blockchain", "web3", "solidity",
+    "unity", "unreal engine", "game development", "ar", "vr", "iot", "edge computing",
+    "communication", "leadership", "problem solving", "teamwork", "office"
+})
+
+# Salary amounts such as "$120,000", "£45.50" or "85k"; a "401k" retirement plan is never an amount
+_AMOUNT = r'(?<![\d.,])(?!401k)\d+(?:,\d+)*(?:\.\d+)?k?'
+SALARY_NUMBER = rf'[\$£€¥]?{_AMOUNT}'
+# A range starts at an amount with a currency symbol, or at a bare amount right after a salary word
+# ("salary: 85k - 95k"), and its optional upper end must follow directly ("$120,000 - $140,000");
+# other numbers in a description ("5+ years") are not salaries
+_SALARY_RANGE_PATTERN = re.compile(
+    rf'(?:(?P<first>[\$£€¥]{_AMOUNT})|(?:salary|pay|compensation)[^\d\$£€¥]{{0,15}}?(?P<bare>{_AMOUNT}))'
+    rf'(?:\s*(?:-|–|—|to|and)\s*(?P<second>{SALARY_NUMBER}))?'
+)
+HOURS_PER_YEAR = 40 * 52
+CURRENCY_SYMBOLS = {'$': 'USD', '£': 'GBP', '€': 'EUR', '¥': 'JPY'}  # amounts without a symbol are USD
+SALARY_RANGE = (10000, 500000)  # plausible yearly salaries
+
+SEARCH_URL = "https://www.google.com/search"
+# Shown by Google Jobs when a search has no results
+NO_RESULTS_MESSAGES = ("did not match any jobs", "no jobs matched")
+
+# Identical searches within SERP_CACHE_TTL seconds (default 6 hours) reuse the stored page
+RESPONSE_CACHE = ResponseCache(ttl=int(os.getenv("SERP_CACHE_TTL", 6*60*60)))
+
+# Shared by every fetch so all callers pace themselves against the same per-host budget
+RATE_LIMITER = AdaptiveRateLimiter()
+
+# Headers that mimic a browser for job searches
+JOB_SEARCH_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.5",
+    "Accept-Encoding": "gzip, deflate, br",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1",
+    "Cache-Control": "max-age=0",
+    "Sec-Fetch-Dest": "document",
+    "Sec-Fetch-Mode": "navigate",
+    "Sec-Fetch-Site": "none",
+    "Sec-Fetch-User": "?1"
+}
+
+# Job card selectors for Google Jobs results pages: the current markup first,
+# then generic alternatives tried only when the first set finds nothing
+JOB_CARD_SELECTORS = [
+    {
+        "card": {"tags": "div", "classes": ['iFjolb', 'gws-plugins-horizon-jobs__job-card']},
+        "fields": {
+            "title": (['h2', 'h3'], ['BjJfJf', 'job-title']),
+            "company_name": (['div', 'span'], ['vNEEBe', 'company-name']),
+            "location": (['div', 'span'], ['Qk80Jf', 'location']),
+            "description": (['div', 'span'], ['HBvzbc', 'job-description'])
+        }
+    },
+    {
+        "card": {"tags": "div", "attribute": "data-hveid"},
+        "fields": {
+            "title": (['h2', 'h3', 'div'], ['job-title', 'title', 'heading']),
+            "company_name": (['div', 'span'], ['company-name', 'employer', 'company']),
+            "location": (['div', 'span'], ['location', 'job-location', 'address']),
+            "description": (['div', 'p'], ['description', 'job-description', 'summary'])
+        }
+    }
+]
 
 def get_job_data(query, location="United States", limit=100):
     """
@@ -18,123 +115,224 @@ def get_job_data(query, location="United States", limit=100):
     Returns:
         pd.DataFrame: DataFrame containing job data
     """
-    # Format the search URL for Google Jobs
-    base_url = "https://www.google.com/search"
-    params = {
+    try:
+        html = fetch_html(job_search_params(query, location, limit), JOB_SEARCH_HEADERS, cacheable=has_job_cards)
+        return parse_job_results(html)
+    
+    except Exception as e:
+        print(f"Error fetching job data: {str(e)}")
+        return pd.DataFrame()
+
+def fetch_html(params, headers, cacheable=None):
+    """
+    GET a search results page, reusing a cached body for identical recent requests
+    
+    Args:
+        params (dict): Query string parameters
+        headers (dict): Request headers
+        cacheable (callable): Returns whether a body is worth caching (e.g. has_job_cards),
+            so captcha and empty pages are fetched again next time; None caches any non-empty body
+    
+    Returns:
+        str: Response body
+    """
+    html = RESPONSE_CACHE.get(SEARCH_URL, params)
+    if html is not None:
+        return html
+    
+    # Shared keep-alive session; every attempt, retries of 429 and 5xx responses included,
+    # waits for the host's token bucket instead of a fixed sleep
+    response = http_client.get_with_limiter(SEARCH_URL, RATE_LIMITER, params=params, headers=headers)
+    response.raise_for_status()
+    
+    if cacheable is None or cacheable(response.text):
+        RESPONSE_CACHE.set(SEARCH_URL, params, response.text)
+    return response.text
+
+def job_search_params(query, location="United States", limit=100):
+    """
+    Build the Google Jobs query parameters for a search
+    
+    Args:
+        query (str): Job search query (e.g., "data scientist")
+        location (str): Location to search in
+        limit (int): Number of results to return
+    
+    Returns:
+        dict: Query string parameters
+    """
+    return {
         "q": f"{query} jobs in {location}",
         "ibp": "1",  # Enable job search
         "num": min(limit, 100),
         "source": "hp",
         "tbm": "jobs"  # Specifically request job results
     }
+
+def has_job_cards(html):
+    """Return True if a results page holds at least one titled job card."""
+    extract_cards = JOB_PARSERS[HTML_PARSER]
+    return any(card.get("title") for selectors in JOB_CARD_SELECTORS for card in extract_cards(html, selectors))
+
+def is_no_results_page(html):
+    """Return True if Google Jobs says the search matched nothing (a captcha or block page does not)."""
+    lower = html.lower()
+    return any(message in lower for message in NO_RESULTS_MESSAGES)
+
+def parse_job_results(html, parser=None):
+    """
+    Parse a Google Jobs results page into job rows
     
-    # Add headers to mimic a browser
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-        "Accept-Language": "en-US,en;q=0.5",
-        "Accept-Encoding": "gzip, deflate, br",
-        "Connection": "keep-alive",
-        "Upgrade-Insecure-Requests": "1",
-        "Cache-Control": "max-age=0",
-        "Sec-Fetch-Dest": "document",
-        "Sec-Fetch-Mode": "navigate",
-        "Sec-Fetch-Site": "none",
-        "Sec-Fetch-User": "?1"
-    }
+    Args:
+        html (str): Results page HTML
+        parser (str): Backend from JOB_PARSERS ("lxml" or "html.parser");
+            defaults to HTML_PARSER
     
-    try:
-        # Add random delay to avoid rate limiting
-        time.sleep(random.uniform(2, 4))
-        
-        response = requests.get(base_url, params=params, headers=headers)
-        response.raise_for_status()
-        
-        # Parse the HTML content
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        # Find job listings - updated selectors for Google Jobs
-        job_cards = soup.find_all('div', {'class': ['iFjolb', 'gws-plugins-horizon-jobs__job-card']})
-        
-        job_data = []
-        for card in job_cards:
-            try:
-                # Extract job details with updated selectors
-                title_elem = card.find(['h2', 'h3'], {'class': ['BjJfJf', 'job-title']})
-                company_elem = card.find(['div', 'span'], {'class': ['vNEEBe', 'company-name']})
-                location_elem = card.find(['div', 'span'], {'class': ['Qk80Jf', 'location']})
-                description_elem = card.find(['div', 'span'], {'class': ['HBvzbc', 'job-description']})
-                
-                if title_elem:
-                    job_info = {
-                        "title": title_elem.text.strip(),
-                        "company_name": company_elem.text.strip() if company_elem else "",
-                        "location": location_elem.text.strip() if location_elem else "",
-                        "description": description_elem.text.strip() if description_elem else "",
-                        "posted_at": "",
-                        "schedule_type": "",
-                        "work_from_home": "remote" in (description_elem.text.lower() if description_elem else ""),
-                        "salary": extract_salary(description_elem.text if description_elem else ""),
-                        "description_tokens": extract_skills(description_elem.text if description_elem else "")
-                    }
-                    job_data.append(job_info)
-            except Exception as e:
-                print(f"Error processing job card: {str(e)}")
-                continue
-        
-        # If no jobs found with primary selectors, try alternative selectors
-        if not job_data:
-            # Try finding job cards by data attributes
-            job_cards = soup.find_all('div', {'data-hveid': True})
-            for card in job_cards:
-                try:
-                    # Try alternative selectors
-                    title_elem = card.find(['h2', 'h3', 'div'], {'class': ['job-title', 'title', 'heading']})
-                    company_elem = card.find(['div', 'span'], {'class': ['company-name', 'employer', 'company']})
-                    location_elem = card.find(['div', 'span'], {'class': ['location', 'job-location', 'address']})
-                    description_elem = card.find(['div', 'p'], {'class': ['description', 'job-description', 'summary']})
-                    
-                    if title_elem:
-                        job_info = {
-                            "title": title_elem.text.strip(),
-                            "company_name": company_elem.text.strip() if company_elem else "",
-                            "location": location_elem.text.strip() if location_elem else "",
-                            "description": description_elem.text.strip() if description_elem else "",
-                            "posted_at": "",
-                            "schedule_type": "",
-                            "work_from_home": "remote" in (description_elem.text.lower() if description_elem else ""),
-                            "salary": extract_salary(description_elem.text if description_elem else ""),
-                            "description_tokens": extract_skills(description_elem.text if description_elem else "")
-                        }
-                        job_data.append(job_info)
-                except Exception as e:
-                    print(f"Error processing alternative job card: {str(e)}")
-                    continue
-        
-        # Convert to DataFrame
-        df = pd.DataFrame(job_data)
-        
-        # Add timestamp
-        df["timestamp"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        
-        # Print debug information
-        print(f"Found {len(job_data)} job listings")
-        if len(job_data) == 0:
-            print("HTML content preview:")
-            print(soup.prettify()[:500])  # Print first 500 characters of HTML for debugging
-            
-            # Try to find any job-related elements
-            job_elements = soup.find_all(['div', 'span'], string=lambda text: text and any(keyword in text.lower() for keyword in ['job', 'career', 'position', 'role']))
-            if job_elements:
-                print("\nFound potential job elements:")
-                for elem in job_elements[:5]:
-                    print(f"- {elem.text.strip()}")
+    Returns:
+        pd.DataFrame: DataFrame containing job data
+    """
+    extract_cards = JOB_PARSERS[parser or HTML_PARSER]
+    
+    # Find job listings - updated selectors first, then alternative selectors if nothing matched
+    cards = []
+    for selectors in JOB_CARD_SELECTORS:
+        cards = [card for card in extract_cards(html, selectors) if card.get("title")]
+        if cards:
+            break
+    
+    job_data = []
+    for card in cards:
+        description = card.get("description", "")
+        job_data.append({
+            "title": card["title"],
+            "company_name": card.get("company_name", ""),
+            "location": card.get("location", ""),
+            "description": description,
+            "posted_at": "",
+            "schedule_type": "",
+            "work_from_home": "remote" in description.lower(),
+            "description_tokens": extract_skills(description)
+        })
+    
+    # Convert to DataFrame
+    df = pd.DataFrame(job_data)
+    if not df.empty:
+        df = add_salary_columns(df)
+    
+    # Add timestamp
+    df["timestamp"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    
+    # Print debug information
+    print(f"Found {len(job_data)} job listings")
+    if len(job_data) == 0:
+        soup = bs4.BeautifulSoup(html, 'html.parser')
+        print("HTML content preview:")
+        print(soup.prettify()[:500])  # Print first 500 characters of HTML for debugging
         
-        return df
+        # Try to find any job-related elements
+        job_elements = soup.find_all(['div', 'span'], string=lambda text: text and any(keyword in text.lower() for keyword in ['job', 'career', 'position', 'role']))
+        if job_elements:
+            print("\nFound potential job elements:")
+            for elem in job_elements[:5]:
+                print(f"- {elem.text.strip()}")
     
-    except Exception as e:
-        print(f"Error fetching job data: {str(e)}")
-        return pd.DataFrame()
+    return df
+
+def _job_cards_bs4(html, selectors):
+    """
+    Extract job card fields with BeautifulSoup's pure-Python html.parser
+    
+    Args:
+        html (str): Results page HTML
+        selectors (dict): One entry of JOB_CARD_SELECTORS
+    
+    Returns:
+        list: One dict of stripped field texts per card
+    """
+    soup = bs4.BeautifulSoup(html, 'html.parser')
+    card_selector = selectors["card"]
+    if card_selector.get("attribute"):
+        job_cards = soup.find_all(card_selector["tags"], {card_selector["attribute"]: True})
+    else:
+        job_cards = soup.find_all(card_selector["tags"], {'class': card_selector["classes"]})
+    
+    cards = []
+    for card in job_cards:
+        try:
+            fields = {}
+            for field, (tags, classes) in selectors["fields"].items():
+                elem = card.find(tags, {'class': classes})
+                if elem:
+                    fields[field] = elem.text.strip()
+            cards.append(fields)
+        except Exception as e:
+            print(f"Error processing job card: {str(e)}")
+            continue
+    return cards
+
+def _job_cards_lxml(html, selectors):
+    """
+    Extract job card fields with lxml in a single traversal
+    
+    One XPath union returns every card and every field element in document
+    order; each field is assigned to the enclosing cards that don't have it yet,
+    which matches taking the first match per card as _job_cards_bs4 does.
+    
+    Args:
+        html (str): Results page HTML
+        selectors (dict): One entry of JOB_CARD_SELECTORS
+    
+    Returns:
+        list: One dict of stripped field texts per card
+    """
+    if not html or not html.strip():
+        return []
+    root = lxml_html.fromstring(html)
+    
+    card_xpath = "//" + _xpath_node_test(selectors["card"]["tags"], selectors["card"].get("classes"),
+                                          selectors["card"].get("attribute"))
+    field_tests = {field: _xpath_node_test(tags, classes) for field, (tags, classes) in selectors["fields"].items()}
+    query = " | ".join([card_xpath] + [f"{card_xpath}//{test}" for test in field_tests.values()])
+    
+    cards = []
+    open_cards = []  # (element, fields) for cards enclosing the current position
+    for elem in root.xpath(query):
+        ancestors = set(elem.iterancestors())
+        open_cards = [(card, fields) for card, fields in open_cards if card in ancestors]
+        is_card = _matches_card(elem, selectors["card"])
+        for field, (tags, classes) in selectors["fields"].items():
+            if elem.tag in tags and _has_class(elem, classes):
+                for card, fields in open_cards:
+                    if field not in fields:
+                        fields[field] = elem.text_content().strip()
+        if is_card:
+            fields = {}
+            cards.append(fields)
+            open_cards.append((elem, fields))
+    return cards
+
+def _xpath_node_test(tags, classes=None, attribute=None):
+    # e.g. *[(self::h2 or self::h3) and (contains(concat(' ', normalize-space(@class), ' '), ' job-title '))]
+    tags = [tags] if isinstance(tags, str) else tags
+    conditions = ["(" + " or ".join(f"self::{tag}" for tag in tags) + ")"]
+    if attribute:
+        conditions.append(f"@{attribute}")
+    if classes:
+        conditions.append("(" + " or ".join(
+            f"contains(concat(' ', normalize-space(@class), ' '), ' {cls} ')" for cls in classes
+        ) + ")")
+    return "*[" + " and ".join(conditions) + "]"
+
+def _has_class(elem, classes):
+    return bool(set((elem.get("class") or "").split()) & set(classes))
+
+def _matches_card(elem, card_selector):
+    tags = card_selector["tags"]
+    if elem.tag not in ([tags] if isinstance(tags, str) else tags):
+        return False
+    if card_selector.get("attribute"):
+        return elem.get(card_selector["attribute"]) is not None
+    return _has_class(elem, card_selector["classes"])
 
 def get_technology_trends(query="technology trends", limit=20):
     """
@@ -147,7 +345,6 @@ def get_technology_trends(query="technology trends", limit=20):
     Returns:
         pd.DataFrame: DataFrame containing trend data
     """
-    base_url = "https://www.google.com/search"
     params = {
         "q": query,
         "tbm": "nws",  # News search
@@ -159,11 +356,9 @@ def get_technology_trends(query="technology trends", limit=20):
     }
     
     try:
-        time.sleep(random.uniform(1, 3))
-        response = requests.get(base_url, params=params, headers=headers)
-        response.raise_for_status()
+        html = fetch_html(params, headers)
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = bs4.BeautifulSoup(html, 'html.parser')
         news_cards = soup.find_all('div', {'class': 'g'})
         
         trend_data = []
@@ -197,62 +392,97 @@ def get_technology_trends(query="technology trends", limit=20):
         print(f"Error fetching technology trend data: {str(e)}")
         return pd.DataFrame()
 
-def get_skill_salary_data(skills=None, location="United States"):
+def get_skill_salary_data(skills=None, location="United States", locations=None, max_workers=4):
     """
     Get salary data for specific skills from Google search
     
+    Searches run on a bounded thread pool and share RATE_LIMITER, so the pool only
+    overlaps network waits; the request rate stays within the per-host budget.
+    
     Args:
         skills (list): List of skills to search for
         location (str): Location to search in
+        locations (list): Several locations to search; gives one row per skill and location
+        max_workers (int): Maximum number of searches in flight
     
     Returns:
-        pd.DataFrame: DataFrame containing salary data per skill
+        pd.DataFrame: DataFrame containing salary data per skill (and location)
     """
     if skills is None:
         skills = ["python", "java", "javascript", "sql", "aws", "docker", "kubernetes", "machine learning"]
+    if locations is None:
+        locations = [location]
     
-    skill_data = []
+    searches = [(skill, loc) for loc in locations for skill in skills]
+    results = {}
     
-    for skill in skills:
-        query = f"{skill} salary {location}"
-        base_url = "https://www.google.com/search"
-        params = {"q": query}
-        
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(searches)))) as executor:
+        futures = {
+            executor.submit(fetch_skill_salary, skill, loc): i
+            for i, (skill, loc) in enumerate(searches)
         }
-        
-        try:
-            time.sleep(random.uniform(1, 3))
-            response = requests.get(base_url, params=params, headers=headers)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            snippets = soup.find_all('div', {'class': 'VwiC3b'})
-            
-            salary_info = {
-                "Skill": skill,
-                "Average Salary": extract_salary_from_results(snippets),
-                "Currency": "USD",
-                "Location": location,
-                "Description": f"Average salary for professionals with {skill} skills"
-            }
-            
-            skill_data.append(salary_info)
-            
-        except Exception as e:
-            print(f"Error fetching salary data for {skill}: {str(e)}")
+        for future in as_completed(futures):
+            skill, loc = searches[futures[future]]
+            try:
+                results[futures[future]] = future.result()
+            except Exception as e:
+                print(f"Error fetching salary data for {skill} in {loc}: {str(e)}")
+    
+    # Rows are collected in completion order but returned in request order
+    return pd.DataFrame([results[i] for i in sorted(results)])
+
+def fetch_skill_salary(skill, location="United States"):
+    """
+    Search the salary of one skill in one location
+    
+    Args:
+        skill (str): Skill to search for
+        location (str): Location to search in
+    
+    Returns:
+        dict: One row of get_skill_salary_data
+    """
+    params = {"q": f"{skill} salary {location}"}
+    
+    headers = {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+    }
     
-    return pd.DataFrame(skill_data)
+    html = fetch_html(params, headers, cacheable=lambda page: 'VwiC3b' in page)
+    
+    soup = bs4.BeautifulSoup(html, 'html.parser')
+    snippets = soup.find_all('div', {'class': 'VwiC3b'})
+    average_salary, currency = extract_salary_from_results(snippets)
+    
+    return {
+        "Skill": skill,
+        "Average Salary": average_salary,
+        "Currency": currency,
+        "Location": location,
+        "Description": f"Average salary for professionals with {skill} skills"
+    }
 
-def build_composite_dataset(tech_roles=None, locations=None, save_to_csv=True):
+def build_composite_dataset(tech_roles=None, locations=None, save_to_csv=False, concurrency=4, requests_per_second=None,
+                            resume=True, checkpoint_dir=BUILD_DIR, dataset_dir=DATASET_DIR):
     """
-    Build a composite dataset from multiple queries and save to CSV
+    Build a composite dataset from multiple queries
+    
+    Every (role, location) search is fetched concurrently by an AsyncFetchEngine,
+    so total build time is bounded by the adaptive rate limit rather than per-request sleeps.
+    Each slice is appended to the partitioned Parquet dataset under dataset_dir as
+    soon as it is parsed, so memory stays bounded by one page during the build,
+    an interrupted build picks up where it stopped, and PartitionedDataset(dataset_dir)
+    can read the rows (or just the partitions it needs) while the build is running.
     
     Args:
         tech_roles (list): List of tech roles to query
         locations (list): List of locations to query
-        save_to_csv (bool): Whether to save results to CSV
+        save_to_csv (bool): Also export the combined rows to data/google_jobs_data.csv
+        concurrency (int): Maximum number of requests in flight
+        requests_per_second (float): Starting rate of a private limiter (None shares RATE_LIMITER)
+        resume (bool): Skip slices finished by an earlier run on the same day (False starts over)
+        checkpoint_dir (str): Directory holding the manifest of finished slices
+        dataset_dir (str): Root of the partitioned dataset the slices are appended to
     
     Returns:
         pd.DataFrame: Combined dataset
@@ -272,22 +502,48 @@ def build_composite_dataset(tech_roles=None, locations=None, save_to_csv=True):
             "Seattle", "Austin", "Boston", "Chicago", "London"
         ]
     
-    all_data = []
-    
-    for role in tech_roles:
-        for location in locations:
-            print(f"Fetching data for {role} in {location}...")
-            job_df = get_job_data(role, location, limit=20)
-            
-            if not job_df.empty:
-                job_df["search_role"] = role
-                job_df["search_location"] = location
-                all_data.append(job_df)
-            
-            time.sleep(random.uniform(2, 4))
-    
-    if all_data:
-        combined_df = pd.concat(all_data, ignore_index=True)
+    RESPONSE_CACHE.prune()
+    checkpoint = BuildCheckpoint(checkpoint_dir, store=PartitionedDataset(dataset_dir))
+    if not resume:
+        checkpoint.reset()
+    
+    def collect(key, html, error):
+        # Called as each page arrives, in completion order
+        role, location = key
+        if error is not None:
+            print(f"Error fetching data for {role} in {location}: {str(error)}")
+            return
+        try:
+            job_df = parse_job_results(html)
+        except Exception as e:
+            print(f"Error parsing data for {role} in {location}: {str(e)}")
+            return
+        # A search Google reports as empty is recorded too, so a resumed build does not repeat it;
+        # any other page without job cards (captcha, block page) is left for the next run
+        if job_df.empty and not is_no_results_page(html):
+            print(f"No job results for {role} in {location}; the search will be retried on the next run")
+            return
+        print(f"Fetched data for {role} in {location}")
+        
+        job_df["search_role"] = role
+        job_df["search_location"] = location
+        checkpoint.save_slice(role, location, job_df)
+    
+    pairs = [(role, location) for role in tech_roles for location in locations]
+    searches = [
+        ((role, location), SEARCH_URL, job_search_params(role, location, limit=20))
+        for role, location in pairs
+        if not checkpoint.is_done(role, location)
+    ]
+    if len(searches) < len(pairs):
+        print(f"Resuming build: {len(pairs) - len(searches)} of {len(pairs)} searches already done")
+    rate_limiter = RATE_LIMITER if requests_per_second is None else AdaptiveRateLimiter(rate=requests_per_second)
+    engine = AsyncFetchEngine(concurrency=concurrency, headers=JOB_SEARCH_HEADERS, cache=RESPONSE_CACHE,
+                              rate_limiter=rate_limiter, cacheable=has_job_cards)
+    engine.run(searches, collect)
+    
+    combined_df = checkpoint.load(pairs)
+    if not combined_df.empty:
         
         if save_to_csv:
             os.makedirs("data", exist_ok=True)
@@ -313,65 +569,95 @@ def extract_salary(text):
     try:
         if not text:
             return None
-            
-        text = text.lower()
-        
-        if 'year' in text or 'annual' in text:
-            period = 'yearly'
-        elif 'month' in text or 'monthly' in text:
-            period = 'monthly'
-        elif 'hour' in text or 'hourly' in text:
-            period = 'hourly'
-        else:
-            period = 'unknown'
-        
-        currency = 'USD'
-        if '£' in text:
-            currency = 'GBP'
-        elif '€' in text:
-            currency = 'EUR'
-        elif '¥' in text:
-            currency = 'JPY'
         
-        import re
-        numbers = re.findall(r'[\$£€¥]?\d+(?:,\d+)*(?:\.\d+)?k?', text)
-        
-        if len(numbers) >= 2:
-            min_salary = float(numbers[0].replace('$', '').replace('£', '').replace('€', '').replace('¥', '').replace(',', ''))
-            max_salary = float(numbers[1].replace('$', '').replace('£', '').replace('€', '').replace('¥', '').replace(',', ''))
-            
-            if 'k' in numbers[0].lower():
-                min_salary *= 1000
-            if 'k' in numbers[1].lower():
-                max_salary *= 1000
-                
-            if period == 'hourly':
-                min_salary = min_salary * 40 * 52
-                max_salary = max_salary * 40 * 52
-                period = 'yearly'
-            elif period == 'monthly':
-                min_salary = min_salary * 12
-                max_salary = max_salary * 12
-                period = 'yearly'
-                
-        elif len(numbers) == 1:
-            min_salary = max_salary = float(numbers[0].replace('$', '').replace('£', '').replace('€', '').replace('¥', '').replace(',', ''))
-            if 'k' in numbers[0].lower():
-                min_salary = max_salary = min_salary * 1000
-        else:
+        salary = parse_salaries([text]).iloc[0]
+        if pd.isna(salary['min']):
             return None
         
         return {
-            'min': min_salary,
-            'max': max_salary,
-            'period': period,
-            'currency': currency
+            'min': float(salary['min']),
+            'max': float(salary['max']),
+            'period': salary['period'],
+            'currency': salary['currency']
         }
     
     except Exception as e:
         print(f"Error extracting salary: {str(e)}")
         return None
 
+def add_salary_columns(df, column="description"):
+    """
+    Add parsed salary columns to a job DataFrame
+    
+    Args:
+        df (pd.DataFrame): Job data with a description column
+        column (str): Column to parse salaries from
+        
+    Returns:
+        pd.DataFrame: df with salary (dict), salary_min, salary_max, salary_period,
+            salary_currency and salary_yearly (midpoint of yearly ranges)
+    """
+    salaries = parse_salaries(df[column])
+    df["salary"] = [None if pd.isna(row["min"]) else row for row in salaries.to_dict("records")]
+    df["salary_min"] = salaries["min"]
+    df["salary_max"] = salaries["max"]
+    df["salary_period"] = salaries["period"]
+    df["salary_currency"] = salaries["currency"]
+    df["salary_yearly"] = ((salaries["min"] + salaries["max"]) / 2).where(salaries["period"] == "yearly")
+    return df
+
+def parse_salaries(texts):
+    """
+    Extract salary information from many texts in one vectorized pass
+    
+    Hourly and monthly amounts are normalised to yearly. Ranges whose ends are out of
+    order or outside SALARY_RANGE are discarded.
+    
+    Args:
+        texts (pd.Series or list): Texts containing salary information
+        
+    Returns:
+        pd.DataFrame: min, max, period and currency columns (aligned with a Series
+            input's index); rows without any amount are left empty
+    """
+    texts = pd.Series(texts, dtype=object)
+    lower = texts.fillna("").astype(str).str.lower()
+    
+    # The first salary range in each text; a single amount is both ends
+    amounts = lower.str.extract(_SALARY_RANGE_PATTERN)
+    min_salary = _salary_amounts(amounts['first'].fillna(amounts['bare']))
+    max_salary = _salary_amounts(amounts['second']).fillna(min_salary)
+    
+    period = np.select(
+        [lower.str.contains('year|annual'), lower.str.contains('month'), lower.str.contains('hour')],
+        ['yearly', 'monthly', 'hourly'],
+        default='unknown'
+    )
+    currency = np.select(
+        [lower.str.contains('£', regex=False), lower.str.contains('€', regex=False), lower.str.contains('¥', regex=False)],
+        ['GBP', 'EUR', 'JPY'],
+        default='USD'
+    )
+    factor = np.select([period == 'hourly', period == 'monthly'], [HOURS_PER_YEAR, 12], default=1)
+    plausible = (min_salary <= max_salary) & (min_salary * factor).between(*SALARY_RANGE) & \
+        (max_salary * factor).between(*SALARY_RANGE)
+    min_salary = min_salary.where(plausible)
+    max_salary = max_salary.where(plausible)
+    
+    salaries = pd.DataFrame({
+        'min': min_salary * factor,
+        'max': max_salary * factor,
+        'period': np.where(factor > 1, 'yearly', period),
+        'currency': currency
+    }, index=texts.index).astype({'period': object, 'currency': object})
+    salaries.loc[min_salary.isna(), ['period', 'currency']] = None
+    return salaries
+
+def _salary_amounts(numbers):
+    # "$120,000" -> 120000.0 and "85k" -> 85000.0, element-wise
+    values = pd.to_numeric(numbers.str.replace(r'[\$£€¥,k]', '', regex=True), errors='coerce')
+    return values * np.where(numbers.str.endswith('k', na=False), 1000, 1)
+
 def extract_skills(description):
     """
     Extract skills from job description using keyword matching
@@ -382,42 +668,114 @@ def extract_skills(description):
     Returns:
         list: List of extracted skills
     """
-    tech_skills = {
-        "python", "java", "javascript", "typescript", "c++", "c#", "ruby", "php", "swift", "kotlin", "go", "rust",
-        "r", "matlab", "scala", "perl", "shell", "bash",
-        "html", "css", "react", "angular", "vue", "node.js", "express", "django", "flask", "spring", "asp.net",
-        "jquery", "bootstrap", "sass", "less", "webpack", "next.js", "nuxt.js",
-        "sql", "mysql", "postgresql", "mongodb", "redis", "elasticsearch", "cassandra", "oracle", "sqlite",
-        "dynamodb", "neo4j", "firebase", "bigquery", "snowflake",
-        "aws", "azure", "gcp", "docker", "kubernetes", "jenkins", "terraform", "ansible", "circleci", "git",
-        "prometheus", "grafana", "elk stack", "splunk", "new relic", "datadog",
-        "machine learning", "deep learning", "tensorflow", "pytorch", "scikit-learn", "pandas", "numpy",
-        "data analysis", "statistics", "spss", "tableau", "power bi", "looker", "d3.js", "matplotlib",
-        "seaborn", "jupyter", "hadoop", "spark", "kafka", "airflow", "dbt",
-        "react native", "flutter", "ios", "android", "xcode", "android studio",
-        "security", "penetration testing", "ethical hacking", "firewall", "vpn", "ssl", "encryption",
-        "agile", "scrum", "jira", "confluence", "trello", "asana", "project management",
-        "rest api", "graphql", "microservices", "ci/cd", "blockchain", "web3", "solidity",
-        "unity", "unreal engine", "game development", "ar", "vr", "iot", "edge computing",
-        "communication", "leadership", "problem solving", "teamwork", "office"
-    }
-    
     if not description:
         return []
     
-    desc_lower = description.lower()
-    found_skills = []
-    
-    for skill in tech_skills:
-        if skill in desc_lower:
-            if skill == 'r':
-                if not any(x in desc_lower for x in ['ruby', 'rust', 'react']):
-                    found_skills.append(skill)
-            else:
-                found_skills.append(skill)
+    # One pass of the precompiled pattern finds every whole-word skill mention
+    found_skills = set(SKILL_PATTERN.findall(description.lower()))
+    for skill in list(found_skills):
+        found_skills.update(_NESTED_SKILLS.get(skill, ()))
     
     return sorted(found_skills)
 
+def extract_skills_batch(descriptions, max_workers=None, executor=None, chunksize=256, min_pool_size=2000):
+    """
+    Extract skills for many descriptions, spreading the work across processes
+    
+    Args:
+        descriptions (pd.Series or list): Job description texts
+        max_workers (int): Worker processes for the shared pool (defaults to the
+            SKILL_EXTRACTION_WORKERS env var, then the CPU count); 1 runs inline
+        executor (concurrent.futures.Executor): Pool to use instead of the shared one
+        chunksize (int): Descriptions sent to a worker per task
+        min_pool_size (int): Smaller batches run inline, since dispatch costs more than it saves
+        
+    Returns:
+        pd.Series or list: Skill list per description (a Series keeps the input index)
+    """
+    index = descriptions.index if isinstance(descriptions, pd.Series) else None
+    texts = [desc if isinstance(desc, str) else "" for desc in descriptions]
+    
+    if executor is None and len(texts) >= min_pool_size:
+        if max_workers is None:
+            max_workers = int(os.getenv("SKILL_EXTRACTION_WORKERS", os.cpu_count() or 1))
+        if max_workers > 1:
+            executor = _skill_pool(max_workers)
+    
+    if executor is None:
+        results = [extract_skills(text) for text in texts]
+    else:
+        results = list(executor.map(extract_skills, texts, chunksize=chunksize))
+    
+    return pd.Series(results, index=index, dtype=object) if index is not None else results
+
+def _skill_pool(max_workers):
+    # Reuse one pool per process so repeated calls (e.g. Streamlit reruns) don't respawn workers
+    global _SKILL_POOL
+    if _SKILL_POOL is None or _SKILL_POOL[0] != max_workers:
+        if _SKILL_POOL is not None:
+            _SKILL_POOL[1].shutdown(wait=False)
+        _SKILL_POOL = (max_workers, ProcessPoolExecutor(max_workers=max_workers))
+    return _SKILL_POOL[1]
+
+def compile_skill_pattern(skills):
+    """
+    Compile a skill list into one regex that scans a description in a single pass
+    
+    Skills are merged into a prefix trie so matching cost stays flat as the list
+    grows; longer skills win at the same position ("react native" over "react")
+    and matches must sit on word boundaries so "r" and "go" don't match inside words.
+    
+    Args:
+        skills (iterable): Lower-case skill strings
+        
+    Returns:
+        re.Pattern: Compiled pattern whose findall() returns matched skills
+    """
+    trie = {}
+    for skill in skills:
+        node = trie
+        for char in skill:
+            node = node.setdefault(char, {})
+        node[""] = {}  # marks the end of a skill
+    
+    def build(node):
+        if list(node) == [""]:
+            return ""
+        alternatives = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        pattern = alternatives[0] if len(alternatives) == 1 else "(?:" + "|".join(alternatives) + ")"
+        if "" in node:
+            pattern = "(?:" + pattern + ")?"  # greedy, so the longer skill is tried first
+        return pattern
+    
+    return re.compile(r"(?<![a-z0-9_])(" + build(trie) + r")(?![a-z0-9_+#])")
+
+# Compiled once per process and shared by every extract_skills call
+SKILL_PATTERN = compile_skill_pattern(TECH_SKILLS)
+
+# Skills that appear as whole words inside longer skills ("android" in "android studio"),
+# since a single left-to-right pass only reports the longest match at each position
+_NESTED_SKILLS = {}
+for _skill in TECH_SKILLS:
+    for _inner in TECH_SKILLS:
+        if _inner != _skill and _inner in _skill and re.search(r"(?<![a-z0-9_])" + re.escape(_inner) + r"(?![a-z0-9_+#])", _skill):
+            _NESTED_SKILLS.setdefault(_skill, []).append(_inner)
+del _skill, _inner
+
+# HTML parser backends for parse_job_results; lxml is used when it is installed
+JOB_PARSERS = {"html.parser": _job_cards_bs4}
+if lxml_html is not None:
+    JOB_PARSERS["lxml"] = _job_cards_lxml
+HTML_PARSER = os.getenv("SERP_HTML_PARSER", "lxml" if lxml_html is not None else "html.parser")
+
+# Shared process pool for extract_skills_batch, created on first use
+_SKILL_POOL = None
+
+@atexit.register
+def _shutdown_skill_pool():
+    if _SKILL_POOL is not None:
+        _SKILL_POOL[1].shutdown(wait=False, cancel_futures=True)
+
 def extract_salary_from_results(snippets):
     """
     Extract salary information from search result snippets
@@ -426,33 +784,26 @@ def extract_salary_from_results(snippets):
         snippets (list): List of BeautifulSoup elements containing snippets
         
     Returns:
-        float: Average salary or None if not found
+        tuple: (average salary, currency code), or (None, None) if not found;
+            only amounts in the most common currency are averaged
     """
     try:
-        salary_sum = 0
-        salary_count = 0
+        texts = pd.Series([snippet.text for snippet in snippets], dtype=object).str.lower()
+        texts = texts[texts.str.contains("salary", regex=False)]
+        if texts.empty:
+            return None, None
         
-        for snippet in snippets:
-            text = snippet.text.lower()
-            if "salary" in text:
-                import re
-                numbers = re.findall(r'\$?\d+(?:,\d+)*(?:\.\d+)?k?', text)
-                for num in numbers:
-                    try:
-                        num = num.replace('$', '').replace(',', '')
-                        if num.endswith('k'):
-                            num = float(num[:-1]) * 1000
-                        else:
-                            num = float(num)
-                        
-                        if 10000 <= num <= 500000:
-                            salary_sum += num
-                            salary_count += 1
-                    except ValueError:
-                        continue
+        numbers = texts.str.extractall(f"({SALARY_NUMBER})")[0]
+        amounts = _salary_amounts(numbers)
+        currencies = numbers.str[0].map(CURRENCY_SYMBOLS).fillna('USD')
+        in_range = amounts.between(*SALARY_RANGE)
+        amounts, currencies = amounts[in_range], currencies[in_range]
+        if amounts.empty:
+            return None, None
         
-        return round(salary_sum / salary_count, 2) if salary_count > 0 else None
+        currency = currencies.mode().iloc[0]
+        return round(amounts[currencies == currency].mean(), 2), currency
     
     except Exception as e:
         print(f"Error extracting salary from results: {str(e)}")
-        return None
+        return None, None